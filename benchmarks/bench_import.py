@@ -0,0 +1,96 @@
+"""
+Benchmark: startup latency and peak RSS of inventrix commands, optionally against an older revision
+
+Usage: python benchmarks/bench_import.py [--repeat 10] [--baseline GIT_REV]
+
+Each measurement runs in a fresh interpreter. `--baseline` exports the given revision
+into a temporary directory with `git archive` and measures it the same way.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    "import file_processor": ["-c", "import core.file_processor"],
+    "render vanilla": ["-c", "from core.file_processor import FileProcessor; FileProcessor('x', '').constants('vanilla')"],
+    "inventrix list": ["main.py", "list"],
+    "inventrix init --help": ["main.py", "init", "--help"],
+}
+
+
+def run(tree: Path, args) -> tuple:
+    """Wall time (s) and peak RSS (KiB) of one fresh interpreter"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable] + args, cwd=tree,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"{' '.join(args)} failed in {tree}")
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return elapsed, usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def import_time(tree: Path, module: str) -> float:
+    """Cumulative import time (ms) of a module from `-X importtime`"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=tree, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        match = re.match(rf"import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$", line)
+        if match:
+            return int(match.group(1)) / 1000
+    return 0.0
+
+
+def measure(tree: Path, repeat: int) -> dict:
+    results = {}
+    for label, args in COMMANDS.items():
+        runs = [run(tree, args) for _ in range(repeat)]
+        results[label] = (statistics.median(t for t, _ in runs), max(rss for _, rss in runs))
+    imports = [import_time(tree, "core.file_processor") for _ in range(repeat)]
+    results["-X importtime core.file_processor"] = (statistics.median(imports) / 1000, None)
+    return results
+
+
+def report(title: str, results: dict, baseline: dict = None):
+    print(f"\n📊 {title}")
+    print("=" * 78)
+    for label, (seconds, rss) in results.items():
+        line = f"   {label:<36} {seconds * 1000:8.1f} ms"
+        line += f"   {rss / 1024:6.1f} MiB" if rss else " " * 13
+        if baseline:
+            before, before_rss = baseline[label]
+            line += f"   ({before * 1000:.1f} ms"
+            line += f", {before_rss / 1024:.1f} MiB)" if before_rss else ")"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure inventrix startup latency and memory")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--baseline", help="Git revision to compare against, e.g. HEAD~1")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as temp:
+            archive = subprocess.run(["git", "archive", args.baseline], cwd=REPO, capture_output=True, check=True)
+            subprocess.run(["tar", "-x", "-C", temp], input=archive.stdout, check=True)
+            baseline = measure(Path(temp), args.repeat)
+
+    results = measure(REPO, args.repeat)
+    report(f"Startup ({args.repeat} runs, median time, peak RSS"
+           + (f"; baseline {args.baseline} in brackets)" if baseline else ")"), results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: startup of the zipapp against a source checkout
+
+Usage: python benchmarks/bench_pyz.py [--repeat 20] [--drop-caches]
+
+Three ways of running the same commands, each in a fresh interpreter:
+
+- checkout, first use: a fresh export of the tree without any `__pycache__`, as on a
+  build agent that just cloned it (every module is compiled before it runs)
+- checkout, cached: the same export once its bytecode cache is written
+- inventrix.pyz: the archive from `tools/build_pyz.py`
+
+`--drop-caches` also empties the OS page cache before every run (Linux, root only),
+so the files are read from disk instead of memory.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from tools.build_pyz import build
+
+COMMANDS = {
+    "list": ["list"],
+    "--help": ["--help"],
+    "init --help": ["init", "--help"],
+}
+
+# The environment may disable bytecode writing; a checkout on an agent would not
+ENV = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+
+
+def drop_caches():
+    os.sync()
+    with open("/proc/sys/vm/drop_caches", "w") as caches:
+        caches.write("3\n")
+
+
+def clear_bytecode(tree: Path):
+    for cache in tree.rglob("__pycache__"):
+        shutil.rmtree(cache)
+
+
+def run(args, cwd: Path, repeat: int, before=None) -> float:
+    """Median wall time (s) of a fresh interpreter; `before` runs ahead of every start"""
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=cwd, env=ENV, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare zipapp and checkout startup")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--drop-caches", action="store_true",
+                        help="Empty the page cache before every run (Linux, needs root)")
+    args = parser.parse_args()
+
+    if args.drop_caches:
+        try:
+            drop_caches()
+        except OSError as e:
+            sys.exit(f"❌ Cannot drop the page cache: {e}")
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        checkout = temp / "checkout"
+        checkout.mkdir()
+        archive = subprocess.run(["git", "archive", "HEAD", "core", "main.py"], cwd=REPO,
+                                 capture_output=True, check=True)
+        subprocess.run(["tar", "-x", "-C", str(checkout)], input=archive.stdout, check=True)
+        pyz = build(temp / "inventrix.pyz")
+
+        def first_use():
+            clear_bytecode(checkout)
+            if args.drop_caches:
+                drop_caches()
+
+        cold = drop_caches if args.drop_caches else None
+        results = {}
+        for label, command in COMMANDS.items():
+            results[label] = (
+                run([str(checkout / "main.py")] + command, temp, args.repeat, first_use),
+                run([str(checkout / "main.py")] + command, temp, args.repeat, cold),
+                run([str(pyz["path"])] + command, temp, args.repeat, cold)
+            )
+
+    print(f"\n📊 Startup ({args.repeat} runs, median"
+          + (", page cache dropped before each run)" if args.drop_caches else ")"))
+    print(f"   inventrix.pyz: {pyz['modules']} modules, {pyz['bytes'] / 1024:.0f} KiB")
+    print("=" * 78)
+    print(f"   {'command':<14} {'checkout, first use':>20} {'checkout, cached':>18} {'inventrix.pyz':>15}")
+    for label, (first, cached, archive) in results.items():
+        print(f"   {label:<14} {first * 1000:17.1f} ms {cached * 1000:15.1f} ms {archive * 1000:12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
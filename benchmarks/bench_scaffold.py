@@ -0,0 +1,231 @@
+"""
+Benchmark: scaffolding speed of every template on tmpfs and on disk, against a stored baseline
+
+Usage: python benchmarks/bench_scaffold.py [--repeat 30] [--tmpfs /dev/shm] [--disk DIR]
+                                           [--baseline benchmarks/baseline.json] [--save-baseline]
+                                           [--tolerance 0.25] [--json]
+
+Each run is a full `Creator.creating_project_structure` with provisioning switched off
+(`provision=False`): rendering, staging, writing the tree and the manifest, and the swap
+into place. Nothing is installed. One unmeasured run per template warms the render caches first.
+
+Syscalls are counted in-process without strace. Python audit events supply the file
+system calls (open, mkdir, rename, ...). On Linux, read and write syscalls come from
+/proc/self/io. stat calls have no audit event and are not counted.
+
+Regressions against the baseline fail the run (exit 1):
+- a median more than `--tolerance` slower (and at least 0.5 ms)
+- any extra syscall
+Timing baselines only mean something on the machine that recorded them. Re-record them
+with `--save-baseline` on the CI runner. The syscall, file and byte counts are portable.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from core.creation import Creator
+
+BASELINE = REPO / "benchmarks" / "baseline.json"
+
+# Medians closer than this are noise, whatever the ratio
+MIN_REGRESSION_MS = 0.5
+
+
+class SyscallCounter:
+    """File system calls seen through audit events while `active`, from any thread"""
+
+    def __init__(self):
+        self.active = False
+        self.counts = Counter()
+        self._lock = threading.Lock()
+        self.overhead = Counter()
+        sys.addaudithook(self._hook)
+        # Reading /proc/self/io costs read syscalls of its own
+        with self.measure() as overhead:
+            pass
+        self.overhead = overhead
+
+    def _hook(self, event, args):
+        if self.active and (event == "open" or event.startswith("os.")):
+            with self._lock:
+                self.counts[event] += 1
+
+    @contextlib.contextmanager
+    def measure(self):
+        """Count the calls of one block; yields the Counter, complete once the block exits"""
+        counts = Counter()
+        before = proc_io()
+        self.counts.clear()
+        self.active = True
+        try:
+            yield counts
+        finally:
+            self.active = False
+            counts.update(self.counts)
+            after = proc_io()
+            if before and after:
+                counts["read"] = after["syscr"] - before["syscr"] - self.overhead["read"]
+                counts["write"] = after["syscw"] - before["syscw"] - self.overhead["write"]
+            counts += Counter()  # Drop zero counts
+
+
+def proc_io() -> dict:
+    """Read/write syscall counters of this process (Linux only)"""
+    try:
+        with open("/proc/self/io", 'r') as f:
+            return {key: int(value) for key, value in (line.split(": ") for line in f.read().splitlines())}
+    except OSError:
+        return {}
+
+
+def filesystem(path: Path) -> str:
+    """Type of the file system holding `path`, from /proc/mounts"""
+    try:
+        with open("/proc/mounts", 'r') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return "unknown"
+    real = os.path.realpath(path)
+    matches = [(mount, fstype) for mount, fstype in mounts
+               if real == mount or real.startswith(mount.rstrip("/") + "/")]
+    return max(matches, key=lambda match: len(match[0]))[1] if matches else "unknown"
+
+
+def scaffold(template: str, name: str, parent: Path) -> Creator:
+    creator = Creator(name=name, description="benchmark", template=template,
+                      base_dir=str(parent), provision=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        creator.creating_project_structure()
+    return creator
+
+
+def measure(template: str, parent: Path, repeat: int, counter: SyscallCounter) -> dict:
+    """Scaffold `template` repeatedly under `parent`"""
+    workdir = Path(tempfile.mkdtemp(prefix="inventrix-bench-", dir=parent))
+    try:
+        shutil.rmtree(scaffold(template, "warmup", workdir).base_path)
+        timings, syscalls = [], Counter()
+        for i in range(repeat):
+            with counter.measure() as counts:
+                start = time.perf_counter()
+                creator = scaffold(template, f"bench_{i}", workdir)
+                timings.append(time.perf_counter() - start)
+            syscalls = counts
+            shutil.rmtree(creator.base_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    files = creator.plan.files
+    p50 = statistics.median(timings)
+    return {
+        "files": len(files),
+        "bytes": sum(len(content.encode('utf-8')) for content in files.values()),
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(statistics.quantiles(timings, n=20, method="inclusive")[18] * 1000, 3),
+        "files_per_s": round(len(files) / p50),
+        "syscalls": sum(syscalls.values()),
+        "syscall_breakdown": dict(sorted(syscalls.items()))
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions of `results` against `baseline`, as readable lines"""
+    regressions = []
+    for template, targets in results.items():
+        for target, result in targets.items():
+            before = baseline.get(template, {}).get(target)
+            if not before:
+                continue
+            label = f"{template} ({target})"
+            slower = result["p50_ms"] - before["p50_ms"]
+            if result["p50_ms"] > before["p50_ms"] * (1 + tolerance) and slower >= MIN_REGRESSION_MS:
+                regressions.append(f"{label}: p50 {result['p50_ms']:.2f} ms vs {before['p50_ms']:.2f} ms")
+            if result["syscalls"] > before["syscalls"]:
+                regressions.append(f"{label}: {result['syscalls']} syscalls vs {before['syscalls']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scaffolding of every template")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--template", action="append", choices=Creator.VALID_TEMPLATES,
+                        help="Template to measure (repeatable, default: all)")
+    parser.add_argument("--tmpfs", type=Path, default=Path("/dev/shm"),
+                        help="Memory-backed directory (default: /dev/shm)")
+    parser.add_argument("--disk", type=Path, default=Path(tempfile.gettempdir()),
+                        help="Disk-backed directory (default: system temp)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed median slowdown before flagging (default: 0.25 = 25%%)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2")
+
+    targets = {label: path for label, path in (("tmpfs", args.tmpfs), ("disk", args.disk)) if path.is_dir()}
+    counter = SyscallCounter()
+    results = {
+        template: {label: measure(template, path, args.repeat, counter) for label, path in targets.items()}
+        for template in args.template or Creator.VALID_TEMPLATES
+    }
+
+    baseline = {}
+    if args.baseline.exists():
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, indent=2))
+    else:
+        print(f"\n📊 Scaffolding, provisioning off ({args.repeat} runs)")
+        for label, path in targets.items():
+            print(f"   {label}: {path} ({filesystem(path)})")
+        print("=" * 96)
+        print(f"   {'template':<22} {'target':<6} {'files':>5} {'bytes':>8} {'p50':>9} {'p95':>9} "
+              f"{'files/s':>9} {'syscalls':>9} {'baseline p50':>13}")
+        for template, by_target in results.items():
+            for label, result in by_target.items():
+                before = baseline.get(template, {}).get(label)
+                reference = f"{before['p50_ms']:10.2f} ms" if before else f"{'-':>13}"
+                print(f"   {template:<22} {label:<6} {result['files']:>5} {result['bytes']:>8} "
+                      f"{result['p50_ms']:>6.2f} ms {result['p95_ms']:>6.2f} ms {result['files_per_s']:>9} "
+                      f"{result['syscalls']:>9} {reference}")
+        if regressions:
+            print("\n❌ Regressions against the baseline:")
+            for line in regressions:
+                print(f"   • {line}")
+        elif baseline:
+            print(f"\n✅ No regressions against {args.baseline}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+                "platform": sys.platform,
+                "repeat": args.repeat,
+                "results": results
+            }, f, indent=2)
+            f.write("\n")
+        print(f"💾 Baseline saved to {args.baseline}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: cold start of light inventrix commands, with an import-time budget for regressions
+
+Usage: python benchmarks/bench_startup.py [--repeat 20] [--budget-ms 10]
+
+For each command the report shows the median wall time, the time above a bare
+interpreter that builds and formats an argparse parser (the CLI framework every
+command needs, including the modules argparse loads lazily), and the
+import time of everything else the command loads according to `python -X importtime`.
+The run fails when that import time exceeds the budget, so a module-level import of
+a heavy subsystem shows up immediately.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    "list": ["list"],
+    "config": ["config"],
+    "--help": ["--help"],
+}
+
+# Cold start means a fresh interpreter, not missing bytecode: measure with the cache
+# written, as after any first run of an installed inventrix
+ENV = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+
+
+def wall(args, cwd: Path, repeat: int) -> float:
+    """Median wall time (s) of a fresh interpreter"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=cwd, env=ENV, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def module_imports(args, cwd: Path) -> dict:
+    """Self import time (us) of every module loaded under `-X importtime`"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=cwd, env=ENV,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(2)] = int(match.group(1))
+    return imports
+
+
+# Python plus argparse, including what it imports lazily while formatting usage and help
+FLOOR = ["-c", "import argparse; argparse.ArgumentParser(prog='x').format_help()"]
+
+
+def command_imports(args, cwd: Path, repeat: int) -> tuple:
+    """Median import time (ms) of what a command loads beyond interpreter startup and argparse"""
+    baseline = set(module_imports(FLOOR, cwd))
+    totals, modules = [], set()
+    for _ in range(repeat):
+        extra = {name: us for name, us in module_imports(args, cwd).items() if name not in baseline}
+        totals.append(sum(extra.values()) / 1000)
+        modules.update(extra)
+    return statistics.median(totals), sorted(modules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure inventrix cold start")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10.0,
+                        help="Fail when a command's own imports take longer (default: 10 ms)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    entry = str(REPO / "main.py")
+    results = {}
+    # An empty directory: `config` then exits early on the missing compy.json,
+    # which still exercises the whole import path of the command
+    with tempfile.TemporaryDirectory() as cwd:
+        cwd = Path(cwd)
+        # One warm-up run of each command writes the bytecode cache
+        for command in COMMANDS.values():
+            wall([entry] + command, cwd, 1)
+        floor = wall(FLOOR, cwd, args.repeat)
+        for label, command in COMMANDS.items():
+            seconds = wall([entry] + command, cwd, args.repeat)
+            imports, modules = command_imports([entry] + command, cwd, max(3, args.repeat // 4))
+            results[label] = {
+                "wall_ms": round(seconds * 1000, 2),
+                "above_argparse_ms": round((seconds - floor) * 1000, 2),
+                "imports_ms": round(imports, 2),
+                "modules": modules
+            }
+
+    over = [label for label, result in results.items() if result["imports_ms"] > args.budget_ms]
+    if args.json:
+        print(json.dumps({"argparse_floor_ms": round(floor * 1000, 2), "commands": results}, indent=2))
+    else:
+        print(f"\n📊 Cold start ({args.repeat} runs; python + argparse alone: {floor * 1000:.1f} ms)")
+        print("=" * 78)
+        for label, result in results.items():
+            flag = "❌" if label in over else "✅"
+            print(f"   {flag} {label:<10} wall {result['wall_ms']:7.1f} ms   "
+                  f"+{result['above_argparse_ms']:6.1f} ms over argparse   "
+                  f"imports {result['imports_ms']:6.2f} ms")
+            print(f"      loads: {', '.join(result['modules'])}")
+        print(f"\n   import budget: {args.budget_ms:.1f} ms per command")
+    if over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: `python -m venv` through a shell vs. in-process EnvBuilder with a cached pip
+
+Usage: python benchmarks/bench_venv.py [--repeat 5] [--copies]
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.environment import cached_pip, create_venv, venv_bin_dir
+
+
+def shell_venv(path: Path, symlinks: bool):
+    """The previous code path in Creator.python_venv"""
+    subprocess.run(f"python -m venv {path}", shell=True, check=True)
+
+
+def in_process_venv(path: Path, symlinks: bool):
+    create_venv(path, symlinks=symlinks)
+
+
+def measure(create, repeat: int, symlinks: bool):
+    timings = []
+    for _ in range(repeat):
+        parent = Path(tempfile.mkdtemp())
+        start = time.perf_counter()
+        create(parent / "venv", symlinks)
+        timings.append(time.perf_counter() - start)
+        # Both paths must leave a working pip behind
+        subprocess.run([str(venv_bin_dir(parent / "venv") / "pip"), "--version"],
+                       check=True, stdout=subprocess.DEVNULL)
+        shutil.rmtree(parent)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare venv creation paths")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--copies", action="store_true", help="Copy the interpreter instead of symlinking")
+    args = parser.parse_args()
+
+    cached_pip()  # Extract the pip wheel once, outside the measurement
+    symlinks = not args.copies
+    results = {
+        "shell": measure(shell_venv, args.repeat, symlinks),
+        "envbuilder": measure(in_process_venv, args.repeat, symlinks),
+    }
+
+    print(f"\n📊 venv creation ({args.repeat} runs, {'copies' if args.copies else 'symlinks'})")
+    print("=" * 50)
+    for label, timings in results.items():
+        print(f"   {label:<12} median {statistics.median(timings) * 1000:8.1f} ms   "
+              f"min {min(timings) * 1000:8.1f} ms")
+    speedup = statistics.median(results["shell"]) / statistics.median(results["envbuilder"])
+    print(f"\n   speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
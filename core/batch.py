@@ -0,0 +1,153 @@
+"""
+Batch scaffolding - create many projects from one manifest across a process pool
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List
+
+from core.cache import cache_dir
+from core.dependencies import DEFAULT_PROFILE, PROFILES
+
+
+def load_manifest(path: Path) -> Dict:
+    """
+    Read and validate a batch manifest
+
+    The manifest is either a list of project entries or an object with a `projects`
+    list and an optional `concurrency`. Each entry needs a `name` and may set
+    `template`, `description`, `profile` and `locked`.
+
+    Args:
+        path (Path): Manifest file
+
+    Returns:
+        dict: `projects` (normalised entries) and `concurrency` (int or None)
+    """
+    from core.creation import Creator
+
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        manifest = {"projects": manifest}
+
+    projects = []
+    seen = set()
+    for index, entry in enumerate(manifest.get("projects", [])):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ValueError(f"Entry {index} has no project name")
+        name = entry["name"]
+        template = entry.get("template", "vanilla")
+        profile = entry.get("profile", DEFAULT_PROFILE)
+        if name in seen:
+            raise ValueError(f"Project '{name}' appears more than once")
+        if template not in Creator.VALID_TEMPLATES:
+            raise ValueError(f"Project '{name}': unknown template '{template}'")
+        if profile not in PROFILES:
+            raise ValueError(f"Project '{name}': unknown profile '{profile}'")
+        seen.add(name)
+        projects.append({
+            "name": name,
+            "template": template,
+            "description": entry.get("description") or f"A {template} project created with Inventrix",
+            "profile": profile,
+            "locked": bool(entry.get("locked", False))
+        })
+
+    return {"projects": projects, "concurrency": manifest.get("concurrency")}
+
+
+def _create_project(entry: Dict, base_dir: str, log_dir: str) -> Dict:
+    """Process pool worker: scaffold one project with its output sent to a log file"""
+    from core.creation import Creator
+
+    log_path = Path(log_dir) / f"{entry['name']}.log"
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        # Redirect the file descriptors too, so pip's output stays out of the terminal
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            Creator(
+                name=entry["name"],
+                description=entry["description"],
+                template=entry["template"],
+                base_dir=base_dir,
+                locked=entry["locked"],
+                profile=entry["profile"]
+            ).creating_project_structure()
+            error = None
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+    return {
+        "name": entry["name"],
+        "template": entry["template"],
+        "ok": error is None,
+        "error": error,
+        "seconds": time.perf_counter() - started,
+        "log": str(log_path)
+    }
+
+
+def run_batch(projects: List[Dict], base_dir: str = ".", max_workers: int = None) -> Dict:
+    """
+    Create every project of a manifest
+
+    Projects sharing a requirement set (template, profile, locked) are scheduled so
+    the first one runs alone and populates the shared package store; the rest start
+    once it finishes and link their packages instead of installing them again.
+    All workers use one pip cache below the Inventrix cache.
+
+    Args:
+        projects (list): Entries from `load_manifest`
+        base_dir (str): Directory the projects are created in
+        max_workers (int): Process pool size (default: CPU count)
+
+    Returns:
+        dict: `results` (one dict per project, in manifest order) and `seconds` (wall time)
+    """
+    base_dir = str(Path(base_dir).resolve())
+    log_dir = Path(base_dir) / ".inventrix-batch"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("PIP_CACHE_DIR", str(cache_dir("pip-cache")))
+
+    groups: Dict[tuple, List[Dict]] = {}
+    for entry in projects:
+        groups.setdefault((entry["template"], entry["profile"], entry["locked"]), []).append(entry)
+
+    results = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as pool:
+        pending = {
+            pool.submit(_create_project, members[0], base_dir, str(log_dir)): key
+            for key, members in groups.items()
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                result = future.result()
+                results[result["name"]] = result
+                print(f"   {'✅' if result['ok'] else '❌'} {result['name']:<24} "
+                      f"{result['template']:<16} {result['seconds']:7.2f} s")
+
+                # The first project of a group finished: release the rest of it
+                followers = groups[key][1:]
+                groups[key] = []
+                for entry in followers:
+                    pending[pool.submit(_create_project, entry, base_dir, str(log_dir))] = key
+
+    return {
+        "results": [results[entry["name"]] for entry in projects],
+        "seconds": time.perf_counter() - started
+    }
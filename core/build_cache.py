@@ -0,0 +1,138 @@
+"""
+PyInstaller work directories kept between ComPy builds, with size-capped LRU eviction
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.cache import cache_dir
+
+
+class BuildCache:
+    """
+    Persistent PyInstaller `--workpath` directories in the Inventrix cache
+
+    Each project and build configuration gets its own entry,
+    `<cache>/pyinstaller/<key>/work`. The key hashes the project path, the resolved
+    compy.json and the Python and PyInstaller versions, so a changed configuration or
+    toolchain starts from an empty entry instead of one PyInstaller would have to
+    clean. Every use rewrites the entry's marker file; the marker's mtime is the
+    last use that `evict` orders entries by.
+
+    Args:
+        root (Path): Cache directory (default: `<cache>/pyinstaller`)
+        max_bytes (int): Size the cache is trimmed to after a build
+            (default: `$INVENTRIX_BUILD_CACHE_MB` MiB, or 2 GiB)
+    """
+
+    MARKER = ".inventrix-build-cache.json"
+    DEFAULT_MAX_MB = 2048
+
+    def __init__(self, root: Path = None, max_bytes: int = None):
+        self.root = Path(root) if root else cache_dir("pyinstaller")
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("INVENTRIX_BUILD_CACHE_MB", self.DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(project: Path, config: dict, pyinstaller_version: Optional[str]) -> str:
+        """Entry name for a project, its resolved config and the toolchain"""
+        identity = json.dumps({
+            "project": str(Path(project).resolve()),
+            "config": config,
+            "python": f"{sys.version} ({sys.executable})",
+            "pyinstaller": pyinstaller_version
+        }, sort_keys=True)
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+
+    def acquire(self, project: Path, config: dict, pyinstaller_version: Optional[str]) -> Path:
+        """
+        Work directory for a build, created if needed and marked as just used
+
+        Returns:
+            Path: Directory to pass as `--workpath`
+        """
+        entry = self.root / self.key(project, config, pyinstaller_version)
+        work = entry / "work"
+        work.mkdir(parents=True, exist_ok=True)
+        marker = {"project": str(Path(project).resolve()), "name": config['name'], "last_used": time.time()}
+        temp = entry / f".marker.{uuid.uuid4().hex[:8]}"
+        temp.write_text(json.dumps(marker, indent=2), encoding='utf-8')
+        os.replace(temp, entry / self.MARKER)
+        return work
+
+    def reset(self, work: Path):
+        """Empty a work directory whose contents PyInstaller could not build from"""
+        shutil.rmtree(work, ignore_errors=True)
+        work.mkdir(parents=True, exist_ok=True)
+
+    def entries(self) -> List[Dict]:
+        """Every entry with its marker, size and last use, least recently used first"""
+        entries = []
+        for entry in self.root.iterdir() if self.root.is_dir() else []:
+            marker_path = entry / self.MARKER
+            try:
+                marker = json.loads(marker_path.read_text(encoding='utf-8'))
+                last_used = marker_path.stat().st_mtime
+            except (OSError, ValueError):
+                marker, last_used = {}, 0.0  # Half-created or damaged: evicted first
+            size = sum(os.lstat(os.path.join(dirpath, name)).st_size
+                       for dirpath, _, filenames in os.walk(entry) for name in filenames)
+            entries.append({"path": entry, "marker": marker, "bytes": size, "last_used": last_used})
+        return sorted(entries, key=lambda e: e["last_used"])
+
+    def evict(self, keep: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Remove least recently used entries until the cache fits `max_bytes`
+
+        Args:
+            keep (Path): Work directory (or entry) that must survive, e.g. the one just built
+
+        Returns:
+            dict: Entries removed and bytes freed
+        """
+        keep = Path(keep) if keep else None
+        entries = self.entries()
+        total = sum(e["bytes"] for e in entries)
+        removed = freed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and (entry["path"] == keep or entry["path"] in keep.parents):
+                continue
+            shutil.rmtree(entry["path"], ignore_errors=True)
+            total -= entry["bytes"]
+            removed += 1
+            freed += entry["bytes"]
+        return {"entries": removed, "bytes": freed}
+
+    def clear(self, project: Optional[Path] = None) -> int:
+        """
+        Remove entries, all of them or only those of one project
+
+        Returns:
+            int: Number of entries removed
+        """
+        project = str(Path(project).resolve()) if project else None
+        removed = 0
+        for entry in self.entries():
+            if project is None or entry["marker"].get("project") == project:
+                shutil.rmtree(entry["path"], ignore_errors=True)
+                removed += 1
+        return removed
+
+    def status(self) -> Dict[str, int]:
+        """Number of entries and bytes held, and the size cap"""
+        entries = self.entries()
+        return {
+            "entries": len(entries),
+            "bytes": sum(e["bytes"] for e in entries),
+            "max_bytes": self.max_bytes
+        }
@@ -0,0 +1,32 @@
+"""
+Location of Inventrix's per-user cache directory
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+def cache_dir(*parts: str) -> Path:
+    """
+    Resolve (and create) a directory inside the Inventrix cache
+
+    The root is `$INVENTRIX_CACHE_DIR` when set, otherwise `%LOCALAPPDATA%\\inventrix`
+    on Windows and `$XDG_CACHE_HOME/inventrix` (default `~/.cache/inventrix`) elsewhere.
+
+    Args:
+        parts (str): Sub-directories below the cache root
+
+    Returns:
+        Path: The existing directory
+    """
+    root = os.environ.get("INVENTRIX_CACHE_DIR")
+    if not root:
+        if sys.platform == "win32":
+            root = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "inventrix"
+        else:
+            root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "inventrix"
+
+    path = Path(root).joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
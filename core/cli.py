@@ -0,0 +1,743 @@
+"""
+Inventrix command line interface
+
+Lives in a module rather than in main.py so its bytecode is cached; a script is
+recompiled on every run.
+"""
+
+import argparse
+import sys
+from core.dependencies import DEFAULT_PROFILE, PROFILES
+from core.templates import template_index, template_names
+
+# Subsystems are imported inside the command that needs them, so `list`, `config`
+# and `--help` do not pay for the scaffolding, packaging and build machinery
+
+def validate_project_name(name: str) -> bool:
+    """
+    Validate project name for invalid characters
+    
+    Args:
+        name: Project name to validate
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    invalid_chars = '<>:"/\\|?*'
+    if any(char in name for char in invalid_chars):
+        print(f"Error: Project name contains invalid characters: {invalid_chars}")
+        return False
+    if not name or name.isspace():
+        print("Error: Project name cannot be empty")
+        return False
+    return True
+
+def report_timings(recorder, table: bool, json_path: str = None, trace_path: str = None):
+    """Print and/or save the phase timings recorded during the command"""
+    if table:
+        print(recorder.format_table())
+    if json_path:
+        recorder.save(json_path)
+        print(f"⏱️  Timings written to {json_path}")
+    if trace_path:
+        recorder.save_trace(trace_path)
+        print(f"⏱️  Trace written to {trace_path} (open in ui.perfetto.dev or chrome://tracing)")
+
+def main():
+    """
+    The main entry point of Inventrix
+    """
+    
+    template_choices = template_names()
+    
+    parser = argparse.ArgumentParser(
+        prog="inventrix",
+        description="Intelligent project scaffolding and compiling tool.",
+        usage="%(prog)s [command] [options]",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Available Commands:
+
+  --- Project Scaffolding (Inventrix) ---
+  init <name> [options]    Initialize a new project from a template.
+  init-batch <manifest>    Create every project listed in a JSON manifest.
+  update [project]         Re-render a project, keeping local edits and the venv.
+  list                     List all available project templates.
+  status <project>         Show venv provisioning progress of a project.
+  pool warm|status|clear   Manage pre-warmed virtual environments.
+  store gc|status          Manage the shared package store.
+  wheelhouse sync|status   Prefetch wheels for offline installs.
+  lock [options]           Pin template requirements with hashes.
+
+  --- Project Compilation (ComPy) ---
+  compy-init               Initialize ComPy build config (compy.json).
+  build                    Build executable using compy.json.
+  run                      Build and run executable.
+  clean                    Clean build artifacts (dist, build cache, .spec).
+  config                   Show current ComPy configuration.
+  build-cache status|clear Manage cached PyInstaller work directories.
+
+Examples:
+  inventrix init my_new_app -t web-flask
+  inventrix init my_script -t automation --profile minimal
+  inventrix init-batch workshop.json -j 8
+  inventrix list
+  inventrix pool warm --template web-flask --size 2
+  inventrix --timings init my_app -t web-flask
+  inventrix --trace build-trace.json build
+  
+  (After scaffolding, 'cd' into the project)
+  cd my_new_app
+  inventrix compy-init
+  inventrix build
+  inventrix run
+"""
+    )
+    
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a per-phase timing breakdown when the command finishes"
+    )
+    parser.add_argument(
+        "--timings-json",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Write the per-phase timings as JSON to FILE"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        type=str,
+        default=None,
+        help="Write a Chrome/Perfetto trace-event file of the run to FILE"
+    )
+    
+    sub_parser = parser.add_subparsers(
+        dest="command",
+        help="Available commands",
+        required=True
+    )
+    
+    # --- Inventrix Scaffolding Commands ---
+    
+    # Init command (scaffolding)
+    init_command = sub_parser.add_parser(
+        "init",
+        help="Initialize a new project from a template."
+    )
+    init_command.add_argument(
+        "name",
+        type=str,
+        help="Project name"
+    )
+    init_command.add_argument(
+        "-t", "--template",
+        type=str,
+        default="vanilla",
+        choices=template_choices,
+        help="Template to use for the project"
+    )
+    init_command.add_argument(
+        "-d", "--description",
+        type=str,
+        default="",
+        help="Project description (optional)"
+    )
+    init_command.add_argument(
+        "-p", "--profile",
+        type=str,
+        default=DEFAULT_PROFILE,
+        choices=PROFILES,
+        help="Dependency profile: minimal, standard or full (default: full)"
+    )
+    init_command.add_argument(
+        "--locked",
+        action="store_true",
+        help="Install the template's lock (see 'lock') with --no-deps"
+    )
+    init_command.add_argument(
+        "-b", "--background",
+        action="store_true",
+        help="Return once the files are written; create the venv in a background worker"
+    )
+    
+    # Init-batch command (many projects from one manifest)
+    init_batch_command = sub_parser.add_parser(
+        "init-batch",
+        help="Create every project listed in a JSON manifest."
+    )
+    init_batch_command.add_argument(
+        "manifest",
+        type=str,
+        help="JSON manifest: a list of {name, template, description, profile} entries"
+    )
+    init_batch_command.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Projects created in parallel (default: manifest 'concurrency' or CPU count)"
+    )
+    init_batch_command.add_argument(
+        "-o", "--output-dir",
+        type=str,
+        default=".",
+        help="Directory the projects are created in (default: current directory)"
+    )
+    
+    # Update command (incremental re-scaffolding)
+    update_command = sub_parser.add_parser(
+        "update",
+        help="Re-render a project, keeping local edits and the venv."
+    )
+    update_command.add_argument(
+        "project",
+        type=str,
+        nargs="?",
+        default=".",
+        help="Project directory (default: current directory)"
+    )
+    update_command.add_argument(
+        "-p", "--profile",
+        type=str,
+        default=None,
+        choices=PROFILES,
+        help="Switch to another dependency profile (default: the project's own)"
+    )
+    update_command.add_argument(
+        "--locked",
+        action="store_true",
+        help="Switch the project to the template's lock"
+    )
+    update_command.add_argument(
+        "-b", "--background",
+        action="store_true",
+        help="Rebuild the venv, if needed, in a background worker"
+    )
+    
+    # List templates command
+    list_command = sub_parser.add_parser(
+        "list",
+        help="List all available project templates."
+    )
+    
+    # Status command (environment provisioning progress)
+    status_command = sub_parser.add_parser(
+        "status",
+        help="Show venv provisioning progress of a project."
+    )
+    status_command.add_argument(
+        "project",
+        type=str,
+        help="Project directory"
+    )
+    
+    # Pool command (pre-warmed virtual environments)
+    pool_command = sub_parser.add_parser(
+        "pool",
+        help="Manage pre-warmed virtual environments used by init."
+    )
+    pool_sub_parser = pool_command.add_subparsers(
+        dest="pool_command",
+        required=True
+    )
+    pool_warm_command = pool_sub_parser.add_parser(
+        "warm",
+        help="Build ready-to-claim venvs for a template."
+    )
+    pool_warm_command.add_argument(
+        "-t", "--template",
+        type=str,
+        required=True,
+        choices=template_choices,
+        help="Template to warm venvs for"
+    )
+    pool_warm_command.add_argument(
+        "-p", "--profile",
+        type=str,
+        default=DEFAULT_PROFILE,
+        choices=PROFILES,
+        help="Dependency profile the venvs are built for"
+    )
+    pool_warm_command.add_argument(
+        "-n", "--size",
+        type=int,
+        default=1,
+        help="Number of ready venvs to keep for the template"
+    )
+    pool_sub_parser.add_parser(
+        "status",
+        help="Show the number of ready venvs per template."
+    )
+    pool_clear_command = pool_sub_parser.add_parser(
+        "clear",
+        help="Remove pooled venvs."
+    )
+    pool_clear_command.add_argument(
+        "-t", "--template",
+        type=str,
+        default=None,
+        choices=template_choices,
+        help="Only clear venvs of this template"
+    )
+    
+    # Store command (content-addressed package store)
+    store_command = sub_parser.add_parser(
+        "store",
+        help="Manage the package store shared by generated venvs."
+    )
+    store_sub_parser = store_command.add_subparsers(
+        dest="store_command",
+        required=True
+    )
+    store_sub_parser.add_parser(
+        "gc",
+        help="Remove packages no venv links to any more."
+    )
+    store_sub_parser.add_parser(
+        "status",
+        help="Show the size of the package store."
+    )
+    
+    # Wheelhouse command (offline installs)
+    wheelhouse_command = sub_parser.add_parser(
+        "wheelhouse",
+        help="Prefetch template requirements into a local wheelhouse."
+    )
+    wheelhouse_sub_parser = wheelhouse_command.add_subparsers(
+        dest="wheelhouse_command",
+        required=True
+    )
+    wheelhouse_sync_command = wheelhouse_sub_parser.add_parser(
+        "sync",
+        help="Download and build wheels for template requirements."
+    )
+    wheelhouse_sync_command.add_argument(
+        "-t", "--template",
+        action="append",
+        choices=template_choices,
+        help="Template to sync (repeatable, default: all)"
+    )
+    wheelhouse_sync_command.add_argument(
+        "-p", "--profile",
+        action="append",
+        choices=PROFILES,
+        help="Dependency profile to sync (repeatable, default: all)"
+    )
+    wheelhouse_sync_command.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Number of concurrent downloads"
+    )
+    wheelhouse_sync_command.add_argument(
+        "--index-url",
+        type=str,
+        default=None,
+        help="Package index to download from"
+    )
+    wheelhouse_sync_command.add_argument(
+        "--find-links",
+        type=str,
+        default=None,
+        help="Local directory of distributions to use instead of an index"
+    )
+    wheelhouse_sub_parser.add_parser(
+        "status",
+        help="Show the contents of the wheelhouse."
+    )
+    
+    # Lock command (pinned, hash-checked requirements)
+    lock_command = sub_parser.add_parser(
+        "lock",
+        help="Pin template requirements with hashes for 'init --locked'."
+    )
+    lock_command.add_argument(
+        "-t", "--template",
+        action="append",
+        choices=template_choices,
+        help="Template to lock (repeatable, default: all)"
+    )
+    lock_command.add_argument(
+        "-p", "--profile",
+        action="append",
+        choices=PROFILES,
+        help="Dependency profile to lock (repeatable, default: all)"
+    )
+    lock_command.add_argument(
+        "--index-url",
+        type=str,
+        default=None,
+        help="Package index to resolve against"
+    )
+    lock_command.add_argument(
+        "--find-links",
+        type=str,
+        default=None,
+        help="Local directory of distributions to use instead of an index"
+    )
+    
+    # --- ComPy Compiler Commands ---
+
+    # ComPy Init command
+    compy_init_command = sub_parser.add_parser(
+        "compy-init",
+        help="Initialize ComPy build config (compy.json)"
+    )
+    
+    # Build command
+    build_command = sub_parser.add_parser(
+        'build',
+        help="Build executable using ComPy"
+    )
+    build_command.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Rebuild even if nothing changed since the last build"
+    )
+    
+    # Run command
+    run_command = sub_parser.add_parser(
+        'run',
+        help="Build and run executable using ComPy"
+    )
+    run_command.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Rebuild even if nothing changed since the last build"
+    )
+    
+    # Clean command
+    clean_command = sub_parser.add_parser(
+        'clean',
+        help="Clean previous ComPy build artifacts"
+    )
+    
+    # Config command
+    config_command = sub_parser.add_parser(
+        'config',
+        help="Show current ComPy configuration (compy.json)"
+    )
+    
+    # Build cache command (PyInstaller work directories kept between builds)
+    build_cache_command = sub_parser.add_parser(
+        'build-cache',
+        help="Manage the PyInstaller work directories kept between builds."
+    )
+    build_cache_sub_parser = build_cache_command.add_subparsers(
+        dest="build_cache_command",
+        required=True
+    )
+    build_cache_sub_parser.add_parser(
+        "status",
+        help="Show the size of the build cache."
+    )
+    build_cache_sub_parser.add_parser(
+        "clear",
+        help="Remove every cached work directory."
+    )
+    
+    
+    args = parser.parse_args()
+    
+    if args.timings or args.timings_json or args.trace:
+        # Reported at exit so commands that fail with sys.exit still show where time went
+        import atexit
+        from core import timings
+        atexit.register(report_timings, timings.enable(args.command), args.timings,
+                        args.timings_json, args.trace)
+    
+    # Instantiate ComPy only if a ComPy command is called
+    if args.command in ['compy-init', 'build', 'run', 'clean', 'config']:
+        from core.project_management import ComPy
+        compy = ComPy()
+    
+    # --- Command Logic ---
+    
+    if args.command == "init":
+        from pathlib import Path
+        from core.creation import Creator
+        from core.manifest import ProjectManifest
+        
+        name = args.name
+        template = args.template
+        
+        # Validate project name
+        if not validate_project_name(name):
+            sys.exit(1)
+        
+        # Get description if not provided
+        if hasattr(args, 'description') and args.description:
+            description = args.description
+        elif ProjectManifest(Path(name)).load().get("template") == template:
+            # Re-running init updates the project and keeps its recorded description
+            description = ProjectManifest(Path(name)).load().get("description", "")
+        else:
+            description = input("Description (optional): ").strip()
+            if not description:
+                description = f"A {template} project created with Inventrix"
+        
+        try:
+            print(f"\n🚀 Creating {template} project: {name}")
+            print(f"📝 Description: {description}")
+            print(f"📦 Dependency profile: {args.profile}\n")
+            
+            creator = Creator(name=name, template=template, description=description,
+                              locked=args.locked, profile=args.profile)
+            creator.creating_project_structure(background=args.background)
+            
+            print(f"\n✅ Project '{name}' created successfully!")
+            print(f"📁 Location: ./{name}/")
+            print(f"\n💡 Next steps:")
+            print(f"   cd {name}")
+            print(f"   Check README.md for setup instructions")
+            if args.background:
+                print(f"   inventrix status {name}   (venv is still being provisioned)")
+            
+        except Exception as e:
+            print(f"\n❌ Error creating project: {e}")
+            sys.exit(1)
+            
+    elif args.command == "update":
+        from pathlib import Path
+        from core.creation import Creator
+        from core.manifest import ProjectManifest
+        
+        project_path = Path(args.project).resolve()
+        recorded = ProjectManifest(project_path).load()
+        if not recorded:
+            print(f"❌ No Inventrix manifest found in {args.project}")
+            sys.exit(1)
+        
+        try:
+            print(f"\n🔄 Updating {recorded['template']} project: {project_path.name}\n")
+            creator = Creator(
+                name=project_path.name,
+                description="",
+                template=recorded["template"],
+                base_dir=str(project_path.parent),
+                locked=args.locked or recorded.get("locked", False),
+                profile=args.profile or recorded.get("profile", DEFAULT_PROFILE)
+            )
+            creator.update_project(background=args.background)
+        except Exception as e:
+            print(f"\n❌ Error updating project: {e}")
+            sys.exit(1)
+    
+    elif args.command == "init-batch":
+        from pathlib import Path
+        from core.batch import load_manifest, run_batch
+        
+        try:
+            manifest = load_manifest(Path(args.manifest))
+        except (OSError, ValueError) as e:
+            print(f"❌ Invalid manifest {args.manifest}: {e}")
+            sys.exit(1)
+        projects = manifest["projects"]
+        if not all(validate_project_name(entry["name"]) for entry in projects):
+            sys.exit(1)
+        
+        jobs = args.jobs or manifest["concurrency"]
+        print(f"\n🚀 Creating {len(projects)} projects ({jobs or 'CPU count'} at a time)\n")
+        report = run_batch(projects, base_dir=args.output_dir, max_workers=jobs)
+        
+        results = report["results"]
+        failed = [result for result in results if not result["ok"]]
+        busy = sum(result["seconds"] for result in results)
+        print(f"\n📊 {len(results) - len(failed)} created, {len(failed)} failed "
+              f"in {report['seconds']:.2f} s ({busy:.2f} s of project time)")
+        for result in failed:
+            print(f"   ❌ {result['name']}: {result['error']}")
+            print(f"      log: {result['log']}")
+        print()
+        if failed:
+            sys.exit(1)
+    
+    elif args.command == "list":
+        print("\n📋 Available templates:\n")
+        for template, desc in template_index().items():
+            print(f"   • {template:<20} - {desc}")
+        print()
+    
+    elif args.command == "status":
+        from pathlib import Path
+        from core.provision import ProvisionStatus
+        
+        status = ProvisionStatus(Path(args.project))
+        data = status.load()
+        if not data:
+            print(f"❌ No Inventrix status found in {args.project}")
+            sys.exit(1)
+        
+        state = data["state"]
+        if state in ("queued", "installing") and status.worker_pid() and not status.worker_alive():
+            state = "failed (worker exited)"
+        icons = {"queued": "⏳", "installing": "📦", "ready": "✅"}
+        
+        print(f"\n{icons.get(state, '❌')} {args.project}: {state}")
+        print(f"   template: {data['template']} ({data['profile']}{', locked' if data.get('locked') else ''})")
+        for phase, timing in data.get("phases", {}).items():
+            seconds = timing["seconds"]
+            shown = f"{seconds:8.2f} s" if seconds is not None else "   running"
+            print(f"   • {phase:<10} {shown}")
+        if data.get("error"):
+            print(f"   error: {data['error']}")
+        if status.log_path.exists():
+            print(f"   log: {status.log_path}")
+        print()
+        if state.startswith("failed"):
+            sys.exit(1)
+    
+    elif args.command == "pool":
+        import subprocess
+        from core.file_processor import FileProcessor
+        from core.venv_pool import VenvPool
+        
+        pool = VenvPool()
+        
+        if args.pool_command == "warm":
+            requirements = FileProcessor(name="", description="").constants(args.template, args.profile)["requirements"]
+            try:
+                built = pool.warm(args.template, requirements, args.size)
+            except subprocess.CalledProcessError as e:
+                print(f"\n❌ Error warming pool: {e}")
+                sys.exit(1)
+            print(f"✅ {args.template} ({args.profile}): {built} venv(s) built, {args.size} ready")
+            
+        elif args.pool_command == "status":
+            counts = pool.status()
+            print(f"\n🔥 Venv pool: {pool.root}\n")
+            if not counts:
+                print("   (empty)")
+            for template, count in counts.items():
+                print(f"   • {template:<20} - {count} ready")
+            print()
+            
+        elif args.pool_command == "clear":
+            pool.clear(args.template)
+            print("🗑️  Pool cleared")
+    
+    elif args.command == "store":
+        from core.package_store import PackageStore
+        
+        store = PackageStore()
+        
+        if args.store_command == "gc":
+            removed = store.gc()
+            print(f"🧹 Removed {removed['dists']} package(s) and {removed['objects']} file(s), "
+                  f"freed {removed['bytes'] / 1024 / 1024:.1f} MiB")
+            
+        elif args.store_command == "status":
+            stats = store.status()
+            print(f"\n📦 Package store: {store.root}\n")
+            print(f"   • packages: {stats['dists']}")
+            print(f"   • files:    {stats['objects']}")
+            print(f"   • size:     {stats['bytes'] / 1024 / 1024:.1f} MiB")
+            print()
+    
+    elif args.command == "wheelhouse":
+        from core.file_processor import FileProcessor
+        from core.wheelhouse import Wheelhouse
+        
+        wheelhouse = Wheelhouse()
+        
+        if args.wheelhouse_command == "sync":
+            templates = args.template or template_choices
+            profiles = args.profile or PROFILES
+            processor = FileProcessor(name="", description="")
+            requirement_sets = {
+                f"{t}:{p}": processor.constants(t, p)["requirements"]
+                for t in templates for p in profiles
+            }
+            
+            print(f"📥 Syncing {len(requirement_sets)} requirement set(s) into {wheelhouse.root}")
+            results = wheelhouse.sync(
+                requirement_sets,
+                max_workers=args.jobs,
+                index_url=args.index_url,
+                find_links=args.find_links
+            )
+            for template, (ok, message) in results.items():
+                print(f"   {'✅' if ok else '❌'} {template:<28} - {message}")
+            if not all(ok for ok, _ in results.values()):
+                sys.exit(1)
+                
+        elif args.wheelhouse_command == "status":
+            stats = wheelhouse.status()
+            print(f"\n📥 Wheelhouse: {wheelhouse.root}\n")
+            print(f"   • wheels:           {stats['wheels']}")
+            print(f"   • requirement sets: {stats['synced']}")
+            print()
+    
+    elif args.command == "lock":
+        from core.environment import pip_index_args
+        from core.file_processor import FileProcessor
+        from core.lockfile import LockError, Lockfiles
+        
+        lockfiles = Lockfiles()
+        processor = FileProcessor(name="", description="")
+        index_args = pip_index_args(args.index_url, args.find_links)
+        failed = False
+        
+        for template in args.template or template_choices:
+            for profile in args.profile or PROFILES:
+                label = f"{template}:{profile}"
+                requirements = processor.constants(template, profile)["requirements"]
+                try:
+                    lock = lockfiles.lock(label, requirements, index_args)
+                except LockError as e:
+                    print(f"   ❌ {label:<28} - {e}")
+                    failed = True
+                    continue
+                pinned = sum(1 for line in lock.splitlines() if line and not line.startswith("#"))
+                print(f"   🔒 {label:<28} - {pinned} pinned package(s)")
+        
+        if failed:
+            sys.exit(1)
+    
+    # --- ComPy Command Logic ---
+        
+    elif args.command == "compy-init":
+        print("🚀 Initializing ComPy configuration...")
+        compy.init_project(args)
+
+    elif args.command == "build":
+        compy.build(args)
+
+    elif args.command == "run":
+        compy.run(args)
+
+    elif args.command == "clean":
+        compy.clean(args)
+
+    elif args.command == "config":
+        compy.show_config(args)
+    
+    elif args.command == "build-cache":
+        from core.build_cache import BuildCache
+        
+        build_cache = BuildCache()
+        
+        if args.build_cache_command == "status":
+            stats = build_cache.status()
+            print(f"\n🏗️  Build cache: {build_cache.root}\n")
+            print(f"   • entries: {stats['entries']}")
+            print(f"   • size:    {stats['bytes'] / 1024 / 1024:.1f} MiB "
+                  f"(limit {stats['max_bytes'] / 1024 / 1024:.0f} MiB)")
+            for entry in reversed(build_cache.entries()):
+                marker = entry['marker']
+                print(f"     - {entry['path'].name}  {marker.get('name', '?'):<16} "
+                      f"{entry['bytes'] / 1024 / 1024:>7.1f} MiB  {marker.get('project', '(unknown)')}")
+            print()
+            
+        elif args.build_cache_command == "clear":
+            removed = build_cache.clear()
+            print(f"🗑️  Removed {removed} cached work director{'y' if removed == 1 else 'ies'}")
+        
+    else:
+        # This branch is technically unreachable if subparsers are `required=True`
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,10 +1,28 @@
 import os
 import shutil
 import subprocess
-import platform
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from core import file_processor
+from core import file_processor, timings
+from core.dependencies import DEFAULT_PROFILE
+from core.environment import create_venv, install_requirements, relocate_venv, requirements_key, venv_python, venv_site_packages
+from core.lockfile import Lockfiles
+from core.manifest import ProjectManifest, content_hash
+from core.package_store import PackageStore
+from core.provision import ProvisionStatus
+from core.templates import compile_template, template_names
+from core.venv_pool import VenvPool
+from core.wheelhouse import Wheelhouse
+from core.write_plan import WritePlan
+
+# Windows console-script launchers embed the venv path in a binary, so venvs are built in place there
+RELOCATABLE_VENVS = sys.platform != "win32"
 
 class Creator:
     """
@@ -14,356 +32,466 @@ class Creator:
         name (str): The project name
         description (str): The project description
         template (str): The template type for the project
+        base_dir (str): Directory the project is created in (default: current directory)
+        locked (bool): Install the template's pinned lock with `--no-deps` instead of resolving
+        profile (str): Dependency profile (minimal, standard or full) for requirements.txt
+        provision (bool): Create the project venv; False writes the files only
 
     Returns:
         A complete file structure with all the files intact and with sample code
+
+    Every path is resolved against `base_path` and the process working directory is
+    never changed, so separate Creator instances may generate projects concurrently
+    from different threads. A single instance is not meant to be shared between threads.
     """
 
-    VALID_TEMPLATES = [
-        "web-django",
-        "web-flask", 
-        "web-streamlit",
-        "ml-tensorflow",
-        "ml-torch",
-        "simulation",
-        "automation",
-        "vanilla"
-    ]
+    # Template names, in display order, from the declarative template manifests
+    VALID_TEMPLATES = template_names()
 
-    def __init__(self, name: str, description: str, template: str):
+    def __init__(self, name: str, description: str, template: str, base_dir: Optional[str] = None,
+                 locked: bool = False, profile: str = DEFAULT_PROFILE, provision: bool = True):
         self.name = name
         self.description = description
         self.template = template
+        self.locked = locked
+        self.profile = profile
+        self.provision = provision
         self.processor = file_processor.FileProcessor(name, description)
-        self.base_path = Path(name).resolve()  # Use absolute path
-        self.original_dir = Path.cwd()  # Store original directory
+        self.base_path = (Path(base_dir or ".") / name).resolve()  # Use absolute path
+        self.plan = WritePlan(self.base_path)
+        self.cleanup_thread = None
+        self.status = None
+        # Set when a venv build running on a worker thread is abandoned, see `_abandon_provisioning`
+        self.cancelled = threading.Event()
+
+    def _mkdir(self, dirpath: str):
+        """Queue a directory in the current write plan"""
+        self.plan.add_dir(dirpath)
 
     def _write_file(self, filepath: str, content: str = ""):
-        """Helper method to safely write files"""
-        try:
-            # Use relative path from current directory instead of base_path
-            path = Path(filepath)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except Exception as e:
-            print(f"Error writing {filepath}: {e}")
-            raise
+        """Queue a file in the current write plan; nothing is written until the plan runs"""
+        self.plan.add_file(filepath, content)
 
-    def creating_project_structure(self):
+    def creating_project_structure(self, background: bool = False):
         """
         Creates the file structure according to the template selected
 
+        A project that already carries an Inventrix manifest for the same template is
+        updated in place instead of being rebuilt (see `update_project`).
+
         Args:
-            None
+            background (bool): Return once the files are written and let a detached
+                worker create the venv (progress via `inventrix status`)
 
         Returns:
             A complete file structure as per the template
         """
         
-        # Checking if the folder exists and removing it to avoid conflict
-        if self.base_path.exists():
-            print(f"Note: Removing existing {self.name}.")
-            shutil.rmtree(self.base_path)
-            
-        # Create the project directory
-        self.base_path.mkdir(parents=True)
-        
-        # Change to the project directory
-        os.chdir(self.base_path)
-        
-        # Create common directories (now we're inside the project directory)
-        Path("tests").mkdir(exist_ok=True)
-        Path("docs").mkdir(exist_ok=True)
+        if ProjectManifest(self.base_path).load().get("template") == self.template:
+            return self.update_project(background=background)
         
+        with timings.span("render"):
+            constants, lock = self._render_constants()
         
-        # Get constants and write common files
-        constants = self.processor.constants(self.template)
+        # Build in a sibling staging directory so a failure never leaves a half-built project
+        staging = self.base_path.with_name(f".{self.name}.staging-{uuid.uuid4().hex[:8]}")
+        staging.mkdir(parents=True)
         
-        self._write_file("requirements.txt", constants["requirements"])
-        self._write_file("README.md", constants["README"])  # Fixed: was writing requirements
-        self._write_file(".gitignore", constants["gitignore"])  # Added: missing gitignore
+        # The project directory does not exist yet: keep the status in memory until the swap
+        status = ProvisionStatus(self.base_path)
+        status.persist = False
+        status.start(template=self.template, profile=self.profile, locked=self.locked)
+        started = time.perf_counter()
         
-        self.python_venv()
+        # In the foreground the venv is built next to the project while the tree is written
+        provisioning = None
+        if self.provision and not background and RELOCATABLE_VENVS:
+            provisioning = self._start_provisioning(status, constants["requirements"], lock)
         
         try:
-            template_methods = {
-                "web-django": self.django_structure,
-                "web-flask": self.flask_structure,  # Fixed typo
-                "web-streamlit": self.streamlit_structure,
-                "ml-tensorflow": self.ml_tensorflow_structure,
-                "ml-torch": self.ml_torch_structure,
-                "simulation": self.simulation_structure,
-                "automation": self.automation_structure,
-                "vanilla": self.vanilla_structure
-            }
+            # Collect the whole tree first, then emit it in one pass
+            with timings.span("collect"):
+                self.plan = WritePlan(staging)
+                self._collect_tree(constants, lock)
+                self.plan.add_file(ProjectManifest.PATH, ProjectManifest.render(
+                    {relpath: content_hash(content) for relpath, content in self.plan.files.items()},
+                    self.plan.directories,
+                    **self._manifest_settings(lock if lock is not None else constants["requirements"])
+                ))
             
-            method = template_methods.get(self.template)
-            if method:
-                method()
-            else:
-                raise ValueError(f"Unknown template: {self.template}")
+            with status.phase("tree"):
+                self.plan.execute()
+                with timings.span("swap"):
+                    self._swap_into_place(staging)
                 
-        except Exception as e:
+        except BaseException as e:
             print(f"Error during structure creation: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            if provisioning:
+                self._abandon_provisioning(provisioning)
             raise
-        finally:
-            # Return to original directory
-            os.chdir(self.original_dir)
-            
-    def python_venv(self, requirements: str = "requirements.txt"):
-        """
-        Making a python virtual environment and installs the requirements
         
-        Args: 
-            requirements (str): Requirements file path
-        """
+        if not self.provision:
+            return
         
-        print("Making virtual environment: 'venv'")
-        subprocess.run("python -m venv venv", shell=True, check=True)  # Fixed: added shell=True
+        status.flush()
+        if background:
+            pid = status.spawn_worker()
+            print(f"Provisioning virtual environment in the background (pid {pid}).")
+            return
         
-        # Fixed: platform.system is a method
-        if platform.system() == "Windows":
-            activate_cmd = "venv\\Scripts\\activate.bat"
+        if provisioning:
+            self._finish_provisioning(provisioning)
         else:
-            activate_cmd = "source venv/bin/activate"
-            
-        try:
-            print("Installing requirements...")
-            # Fixed: proper command chaining
-            if platform.system() == "Windows":
-                cmd = "venv\\Scripts\\pip.exe install -r requirements.txt"
-            else:
-                cmd = "venv/bin/pip install -r requirements.txt"
-            
-            subprocess.run(cmd, shell=True, check=True)
-            print("Requirements successfully installed.")
-        except subprocess.CalledProcessError as e:
-            print(f"Error occurred when setting up virtual environment: {e}")
-            raise
-            
-    def django_structure(self):
-        """
-        All django file structure creation
-        
-        Args:
-            None
-            
-        Returns:
-            Complete django file structure
+            self.provision_environment(status)
+        self._print_timings(status, time.perf_counter() - started)
+    
+    def update_project(self, background: bool = False):
         """
+        Bring an existing project up to date with its template in place
 
-        # Create directories
-        Path(self.name).mkdir()
-        Path("core").mkdir()
-        Path("core/migrations").mkdir()  # Added: missing migrations
-        Path("templates").mkdir()  # Fixed: should be at root level
-        Path("static").mkdir()
-        Path("static/css").mkdir()
-        Path("static/js").mkdir()
-        
-        content = self.processor.django()
-        
-        # Write Django files
-        self._write_file("manage.py", content["manage"])
-        self._write_file(f"{self.name}/__init__.py", "")
-        self._write_file(f"{self.name}/asgi.py", content["asgi"])
-        self._write_file(f"{self.name}/settings.py", content["settings"])
-        self._write_file(f"{self.name}/urls.py", content["urls_main"])
-        self._write_file(f"{self.name}/wsgi.py", content["wsgi"])
-        
-        # Write core app files
-        self._write_file("core/__init__.py", "")
-        self._write_file("core/migrations/__init__.py", "")  # Added
-        self._write_file("core/admin.py", content["admin"])
-        self._write_file("core/apps.py", content["apps"])
-        self._write_file("core/models.py", content["models"])
-        self._write_file("core/tests.py", content["tests"])
-        self._write_file("core/urls.py", content["urls_app"])
-        self._write_file("core/views.py", content["views"])
-        
-        self._write_file("templates/index.html", content["index"])
+        Files are re-rendered with the variables recorded in the project manifest and
+        only those whose content changed are rewritten; files the user edited or
+        deleted are left alone. The venv is rebuilt only when the requirement set
+        differs from the one it was provisioned for, or when it is missing or failed.
+
+        Args:
+            background (bool): Provision a rebuilt venv in a detached worker
 
-    def flask_structure(self):  # Fixed: typo in method name
-        """
-        All Flask file structure creation 
-        
-        Args: 
-            None
-            
         Returns:
-            Complete flask structure
+            dict: Paths by outcome (write, unchanged, kept, stale)
         """
+        started = time.perf_counter()
+        manifest = ProjectManifest(self.base_path)
+        recorded = manifest.load()
+        if not recorded:
+            raise ValueError(f"{self.base_path} has no Inventrix manifest; create it with 'inventrix init'")
+        
+        self.description = self.description or recorded.get("description", "")
+        variables = recorded.get("variables", {})
+        self.processor = file_processor.FileProcessor(self.name, self.description,
+                                                      secret_key=variables.get("secret_key"))
+        with timings.span("render"):
+            constants, lock = self._render_constants()
+            self.plan = WritePlan(self.base_path)
+            self._collect_tree(constants, lock)
+        rendered = self.plan.files
+        with timings.span("diff", files=len(rendered)):
+            changes = manifest.diff(rendered)
+        
+        # Install what the project declares once updated, which includes the user's own edits.
+        # Read before anything is written; a deleted requirements file falls back to the rendered one
+        def declared(relpath: str, rendered_text: str) -> str:
+            path = self.base_path / relpath
+            if relpath in changes["write"] or relpath in changes["stale"] or not path.is_file():
+                return rendered.get(relpath, rendered_text)
+            return path.read_text(encoding='utf-8')
+        
+        requirements = declared("requirements.txt", constants["requirements"])
+        if self.locked:
+            lock = declared("requirements.lock", lock)
+        
+        # Emit only what changed, plus directories the template did not have before
+        update = WritePlan(self.base_path)
+        for directory in self.plan.directories - set(recorded.get("directories", [])):
+            update.add_dir(directory)
+        for relpath in changes["write"]:
+            update.add_file(relpath, rendered[relpath])
+        update.execute()
+        with timings.span("remove", files=len(changes["stale"])):
+            for relpath in changes["stale"]:
+                (self.base_path / relpath).unlink()
+        
+        # Edited files keep their recorded hash so they still count as edited next time
+        files = {relpath: content_hash(rendered[relpath]) for relpath in changes["write"] + changes["unchanged"]}
+        files.update({relpath: recorded["files"][relpath]
+                      for relpath in changes["kept"] if relpath in recorded.get("files", {})})
+        
+        settings = self._manifest_settings(lock if lock is not None else requirements)
+        with timings.span("manifest"):
+            manifest.save(files, self.plan.directories, **settings)
+        
+        print(f"Updated {len(changes['write'])} files, {len(changes['unchanged'])} unchanged, "
+              f"{len(changes['kept'])} kept with local changes, {len(changes['stale'])} removed "
+              f"({time.perf_counter() - started:.3f}s)")
+        for relpath in changes["kept"]:
+            print(f"   kept: {relpath}")
+        
+        if not self.provision:
+            return changes
+        
+        status = ProvisionStatus(self.base_path)
+        provisioned = status.load().get("state") == "ready" and venv_python(self.base_path / "venv").exists()
+        if provisioned and recorded.get("requirements_hash") == settings["requirements_hash"]:
+            print("Requirements unchanged; keeping the existing virtual environment.")
+            return changes
+        
+        status.start(template=self.template, profile=self.profile, locked=self.locked)
+        if background:
+            self._retire(self.base_path / "venv")
+            pid = status.spawn_worker()
+            print(f"Provisioning virtual environment in the background (pid {pid}).")
+            return changes
+        
+        if RELOCATABLE_VENVS:
+            self._finish_provisioning(self._start_provisioning(status, requirements, lock))
+        else:
+            self._retire(self.base_path / "venv")
+            self.provision_environment(status)
+        self._print_timings(status, time.perf_counter() - started)
+        return changes
+    
+    def _render_constants(self):
+        """Render the shared files and load the lock of a locked project"""
+        constants = self.processor.constants(self.template, self.profile)
+        removed = constants["requirements_removed"]
+        if removed:
+            print(f"Requirements compiler removed {len(removed)} entr{'y' if len(removed) == 1 else 'ies'}: "
+                  + ", ".join(f"{entry} ({reason})" for entry, reason in removed))
+        
+        lock = None
+        if self.locked:
+            lock = Lockfiles().load(constants["requirements"])
+            if lock is None:
+                raise ValueError(f"No lock recorded for {self.template} ({self.profile}); "
+                                 f"run 'inventrix lock -t {self.template} --profile {self.profile}' first")
+        return constants, lock
+    
+    def _collect_tree(self, constants: dict, lock: Optional[str]):
+        """Queue every directory and file of the template in the current write plan"""
+        computed = {**constants, "lock": lock}
         
-        # Create directories
-        Path("templates").mkdir()
-        Path("static").mkdir()
-        Path("static/css").mkdir()
-        Path("static/js").mkdir()
-        
-        flask_content = self.processor.flask()
-        
-        self._write_file("__init__.py", "")
-        self._write_file("templates/index.html", flask_content["index"])
-        self._write_file("static/css/style.css", "")
-        self._write_file("static/js/script.js", "")  # Added .js extension
-        self._write_file("app.py", flask_content["app"])
-        self._write_file(".env", flask_content["env"])
-                     
-    def streamlit_structure(self):
-        """All streamlit file structure creation 
+        def resolve(ref: str) -> Optional[str]:
+            source, key = ref.split(":", 1)
+            if source != "constants":
+                raise ValueError(f"Unknown content source in template {self.template}: {ref}")
+            return computed[key]
         
-        Args: 
-            None
-            
+        compile_template(self.template, self.plan, self.processor.variables(self.template), resolve)
+    
+    def _manifest_settings(self, installed: str) -> dict:
+        """Settings and variables recorded in the project manifest"""
+        return {
+            "template": self.template,
+            "profile": self.profile,
+            "locked": self.locked,
+            "description": self.description,
+            "variables": {"secret_key": self.processor.secret_key},
+            "requirements_hash": requirements_key(installed)
+        }
+    
+    def provision_environment(self, status: Optional[ProvisionStatus] = None):
+        """
+        Create and install the project venv, recording progress in the project status
+
+        Args:
+            status (ProvisionStatus): Status to report to (default: the project's own)
+        """
+        self.status = status or ProvisionStatus(self.base_path)
+        if not self.status.data:
+            self.status.load()
+        self.status.set_state("installing")
+        try:
+            self.python_venv()
+        except BaseException as e:
+            self.status.set_state("failed", error=str(e) or type(e).__name__)
+            raise
+        self.status.set_state("ready")
+    
+    def _start_provisioning(self, status: ProvisionStatus, requirements: str, lock: Optional[str]):
+        """
+        Start building the venv in a sibling directory on a worker thread
+
+        Pool claim, venv creation and the install only need the requirements, not the
+        project tree, so they run while the tree is written and swapped into place.
+
         Returns:
-            Complete streamlit structure"""
+            tuple: (executor, future, sibling directory) for `_finish_provisioning`
+        """
+        sibling = self.base_path.with_name(f".{self.name}.venv-{uuid.uuid4().hex[:8]}")
+        sibling.mkdir(parents=True)
+        (sibling / "requirements.txt").write_text(requirements, encoding='utf-8')
+        if lock is not None:
+            (sibling / "requirements.lock").write_text(lock, encoding='utf-8')
+        
+        self.status = status
+        self.cancelled = threading.Event()
+        status.set_state("installing")
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"inventrix-venv-{self.name}")
+        
+        def build_venv():
+            with timings.span("provision"):
+                self.python_venv(sibling / "requirements.txt", sibling / "venv")
+        
+        future = executor.submit(timings.bind(build_venv))
+        return executor, future, sibling
+    
+    def _finish_provisioning(self, provisioning):
+        """Wait for the sibling venv, then move it into the project and fix its paths"""
+        executor, future, sibling = provisioning
+        try:
+            with timings.span("wait"):
+                future.result()
+            with self._phase("relocate"):
+                venv_path = self.base_path / "venv"
+                self._retire(venv_path)
+                os.rename(sibling / "venv", venv_path)
+                relocate_venv(venv_path, str(sibling / "venv"))
+        except BaseException as e:
+            self.status.set_state("failed", error=str(e) or type(e).__name__)
+            raise
+        finally:
+            executor.shutdown()
+            shutil.rmtree(sibling, ignore_errors=True)
+        self.status.set_state("ready")
+    
+    def _abandon_provisioning(self, provisioning):
+        """
+        Stop waiting for the sibling venv build and throw it away
+
+        The worker may still be inside EnvBuilder or pip. It stops at its next check of
+        `cancelled` without recording anything in the package store, and the sibling is
+        removed only once it has finished.
+        """
+        executor, future, sibling = provisioning
+        self.cancelled.set()
+        future.add_done_callback(lambda _: shutil.rmtree(sibling, ignore_errors=True))
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _print_timings(self, status: ProvisionStatus, wall: float):
+        """Per-phase timings and how much wall-clock time overlapping them saved"""
+        phases = {name: t["seconds"] or 0.0 for name, t in status.data.get("phases", {}).items()}
+        serial = sum(phases.values())
+        print("\n⏱️  " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in phases.items()))
+        print(f"   wall {wall:.2f}s vs {serial:.2f}s serial (saved {max(0.0, serial - wall):.2f}s)")
+    
+    def _phase(self, name: str):
+        """Time a provisioning phase, in the status when one is attached"""
+        if self.status is None:
+            return timings.span(name)
+        return self.status.phase(name)
             
-        streamlit_content = self.processor.streamlit()
-        
-        Path("pages").mkdir()
+    def _swap_into_place(self, staging: Path):
+        """
+        Move a fully built staging tree to the project path
+
+        An existing project is renamed aside first and deleted on a background
+        thread, so replacing a large tree costs two renames instead of a full rmtree.
+
+        Args:
+            staging (Path): Completed project tree next to `self.base_path`
+        """
+        if not self.base_path.exists():
+            os.rename(staging, self.base_path)
+            return
         
-        self._write_file("app.py", streamlit_content["app"])
-        self._write_file("pages/landing.py", streamlit_content["landing"])
+        print(f"Note: Replacing existing {self.name}.")
+        retired = self.base_path.with_name(f".{self.name}.old-{uuid.uuid4().hex[:8]}")
+        os.rename(self.base_path, retired)
+        try:
+            os.rename(staging, self.base_path)
+        except OSError:
+            os.rename(retired, self.base_path)
+            raise
+        self._remove_in_background(retired)
+    
+    def _retire(self, path: Path):
+        """Move an existing path out of the way and delete it in the background"""
+        if not path.exists():
+            return
+        retired = self.base_path.with_name(f".{self.name}.old-{uuid.uuid4().hex[:8]}")
+        os.rename(path, retired)
+        self._remove_in_background(retired)
+    
+    def _remove_in_background(self, path: Path):
+        """Delete a retired tree without making the caller wait for it"""
+        # Non-daemon so the interpreter finishes the removal before exiting
+        self.cleanup_thread = threading.Thread(
+            target=shutil.rmtree,
+            args=(path,),
+            kwargs={"ignore_errors": True},
+            name=f"inventrix-cleanup-{self.name}"
+        )
+        self.cleanup_thread.start()
             
-    def ml_tensorflow_structure(self):
-        """All Machine learning tensorflow file structure creation 
+    def python_venv(self, requirements: str = "requirements.txt", venv_path: Optional[Path] = None):
+        """
+        Making a python virtual environment and installs the requirements
+
+        Locked projects install `requirements.lock` with `--no-deps` and use the lock as the
+        requirement set everywhere below. A pre-warmed venv from the pool is claimed when one
+        matches the template and requirements. Otherwise a fresh venv is filled from the package store when the
+        requirement set was installed before, and only as a last resort installed by pip
+        (offline from the local wheelhouse when it covers the requirements), after which
+        the new files are ingested into the store.
         
         Args: 
-            None
-            
-        Returns:
-            Complete tensorflow file structure
+            requirements (str): Requirements file path, relative to the project (or absolute)
+            venv_path (Path): Where to build the venv (default: `<project>/venv`)
         """
-        # Create directories
-        directories = [
-            "data/raw",
-            "data/processed", 
-            "data/external",
-            "notebooks",
-            "src/data",
-            "src/config",
-            "src/models",
-            "src/training",
-            "src/evaluation",
-            "src/utils"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-        
-        # Write files
-        self._write_file("src/data/__init__.py", "")
-        self._write_file("src/data/dataset.py", "# Write your data processing pipeline here\n")
-        self._write_file("src/config/config.yaml", "# Write your model configuration here\n")
-        self._write_file("src/models/model.py", "# Write your model architecture here\nimport tensorflow as tf\n")
-        self._write_file("src/evaluation/metrics.py", "# Write your metrics evaluation here\n")
-        self._write_file("src/evaluation/visualization.py", 
-                        "# Write your visualization evaluation here\nimport matplotlib.pyplot as plt\nimport seaborn as sns\n")
-        self._write_file("src/training/trainer.py", "# Write your training logic here")
-        self._write_file("src/utils/logger.py", "# Write your logging here\nimport logging\n")
-        self._write_file("main.py", "# Put it all together here")
-    
-    def ml_torch_structure(self):
-        """All Machine learning torch file structure creation 
         
-        Args: 
-            None
-            
-        Returns:
-            Complete torch file structure"""
-            
-        # Create directories
-        directories = [
-            "data/raw",
-            "data/processed",
-            "data/external",
-            "notebooks",
-            "src/data",
-            "src/config",
-            "src/models",
-            "src/training",
-            "src/evaluation",
-            "src/utils"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-        
-        # Write files
-        self._write_file("src/data/__init__.py", "")
-        self._write_file("src/data/dataset.py", "# Write your data processing pipeline here\n")
-        self._write_file("src/config/config.yaml", "# Write your model configuration here\n")
-        self._write_file("src/models/model.py", "# Write your model architecture here\nimport torch\n")
-        self._write_file("src/evaluation/metrics.py", "# Write your metrics evaluation here\n")
-        # Fixed: double import and typo in filename
-        self._write_file("src/evaluation/visualization.py",
-                        "# Write your visualization evaluation here\nimport matplotlib.pyplot as plt\nimport seaborn as sns\n")
-        self._write_file("src/utils/logger.py", "# Write your logging here\nimport logging\n")
-        self._write_file("main.py", "# Put it all together here")
-            
-    def simulation_structure(self):
-        """All simulation file structure creation 
+        venv_path = Path(venv_path) if venv_path else self.base_path / "venv"
+        requirements_path = self.base_path / requirements
+        requirements_text = requirements_path.read_text(encoding='utf-8')
         
-        Args: 
-            None
-            
-        Returns:
-            Complete simulation file structure"""
-            
-        # Create directories
-        directories = [
-            "data/input",
-            "data/logs",
-            "data/results",
-            "src/core",
-            "src/configs",
-            "src/visualization",
-            "src/analysis"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-        
-        self._write_file("src/core/__init__.py", "")
-        self._write_file("src/core/environment.py", "# Write your environments here\n")
-        self._write_file("src/core/entities.py", "# Write your entities here\n")
-        self._write_file("src/core/physics.py", "# Give physics to your simulation\n")
-        self._write_file("main.py", "# Put it all together now\n")
-        self._write_file("config.yaml", "# Write your simulation configs\n")
-    
-    def automation_structure(self):
-        """All automation file structure creation 
+        extra_args = []
+        if self.locked:
+            requirements_path = requirements_path.with_name("requirements.lock")
+            requirements_text = requirements_path.read_text(encoding='utf-8')
+            extra_args.append("--no-deps")
         
-        Args: 
-            None
-            
-        Returns:
-            Complete automation file structure"""
-            
-        # Create directories
-        Path("src/core").mkdir(parents=True)
-        Path("src/tasks").mkdir(parents=True)
-        
-        self._write_file("main.py", "# Put everything together\n")
-        self._write_file("config.yaml", "# Write all your configs here\n")  # Fixed: added extension
-        self._write_file("src/core/__init__.py", "")
-        self._write_file("src/core/base_task.py", "# Base class for all automation tasks\n")
-        self._write_file("src/core/scheduler.py", "# Task scheduler or job handler\n")
-        self._write_file("src/core/executor.py", "# Logic for running or chaining tasks\n")
-    
-    def vanilla_structure(self):
-        """All vanilla file structure creation 
+        # Only the exact set a sync resolved installs offline: a lock may pin other versions or hashes
+        wheelhouse = Wheelhouse()
+        offline = wheelhouse.covers(requirements_text)
         
-        Args: 
-            None
-            
-        Returns:
-            Complete vanilla file structure"""
+        with self._phase("pool"):
+            claimed = VenvPool().claim(self.template, requirements_text, venv_path)
+        if claimed:
+            print("Claimed pre-warmed virtual environment: 'venv'")
+            return
+        
+        if self.cancelled.is_set():
+            return
+        print("Making virtual environment: 'venv'")
+        with self._phase("venv"):
+            create_venv(venv_path)
+        
+        # Windows console-script launchers embed the venv path in a binary, so only pip installs there
+        store = PackageStore() if sys.platform != "win32" else None
+        env_key = requirements_key(requirements_text)
+        dist_keys = store.lookup_env(env_key) if store else None
+        if dist_keys is not None:
+            with self._phase("link"):
+                store.populate(venv_path, dist_keys)
+            print(f"Linked {len(dist_keys)} packages from the package store.")
+            return
+        
+        if self.cancelled.is_set():
+            return
+        try:
+            print("Installing requirements...")
+            preinstalled = {p.name for p in venv_site_packages(venv_path).glob("*.dist-info")}
+            with self._phase("install"):
+                if offline:
+                    print(f"Installing from the local wheelhouse: {wheelhouse.root}")
+                    try:
+                        install_requirements(venv_path, requirements_path, cwd=venv_path.parent,
+                                             extra_args=extra_args + wheelhouse.install_args())
+                    except subprocess.CalledProcessError:
+                        print("Offline install from the wheelhouse failed; retrying from the package index...")
+                        offline = False
+                if not offline:
+                    install_requirements(venv_path, requirements_path, cwd=venv_path.parent, extra_args=extra_args)
+            print("Requirements successfully installed.")
+        except subprocess.CalledProcessError as e:
+            print(f"Error occurred when setting up virtual environment: {e}")
+            raise
         
-        Path(self.name).mkdir()
+        # An abandoned build must not record a partial install for this requirement set
+        if store is None or self.cancelled.is_set():
+            return
         
-        self._write_file(f"{self.name}/__init__.py", "")
-        self._write_file(f"{self.name}/core.py", "# Core functions or classes\n")
-        self._write_file(f"{self.name}/utils.py", "# Helper functions\n")
-        self._write_file("main.py", "# main entry point of the code\n")
\ No newline at end of file
+        # Ingest every distribution (pip included) but only record what the requirements added
+        with self._phase("ingest"):
+            ingested = store.ingest(venv_path)
+        store.record_env(env_key, [key for name, key in ingested.items() if name not in preinstalled])
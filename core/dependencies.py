@@ -0,0 +1,40 @@
+"""
+Profiles that select a template's dependency groups
+
+The groups themselves are declared in each template manifest (`core/templates`),
+tagged with the lowest profile that installs them.
+"""
+
+from __future__ import annotations
+
+from core.templates import load_template
+
+# Profiles are cumulative: standard includes minimal, full includes everything
+PROFILES = ["minimal", "standard", "full"]
+DEFAULT_PROFILE = "full"
+
+
+def dependency_groups(template: str, profile: str = DEFAULT_PROFILE) -> list[tuple[str, list[str]]]:
+    """
+    Dependency groups a profile installs for a template
+
+    Args:
+        template (str): Template name
+        profile (str): One of `PROFILES`
+
+    Returns:
+        list: (group name, requirements) pairs in declaration order
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile} (choose from {', '.join(PROFILES)})")
+    level = PROFILES.index(profile)
+    return [
+        (group["group"], group["packages"])
+        for group in load_template(template)["requirements"]
+        if PROFILES.index(group["profile"]) <= level
+    ]
+
+
+def requirements_for(template: str, profile: str = DEFAULT_PROFILE) -> list[str]:
+    """Flat requirement list of a template under a profile"""
+    return [req for _, requirements in dependency_groups(template, profile) for req in requirements]
@@ -0,0 +1,226 @@
+"""
+Virtual environment helpers shared by Creator and the venv pool
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import uuid
+import venv
+import zipfile
+from pathlib import Path
+from typing import List, Optional
+
+from core import timings
+from core.cache import cache_dir
+
+# Console script written for pip when it is bootstrapped from the cache
+PIP_SCRIPT = """#!{python}
+import re
+import sys
+from pip._internal.cli.main import main
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit(main())
+"""
+
+
+def venv_bin_dir(venv_path: Path) -> Path:
+    """Directory holding the interpreter and console scripts of a venv"""
+    return Path(venv_path) / ("Scripts" if sys.platform == "win32" else "bin")
+
+
+def venv_python(venv_path: Path) -> Path:
+    """Interpreter of a venv"""
+    return venv_bin_dir(venv_path) / ("python.exe" if sys.platform == "win32" else "python")
+
+
+def venv_site_packages(venv_path: Path) -> Path:
+    """site-packages directory of a venv"""
+    if sys.platform == "win32":
+        return Path(venv_path) / "Lib" / "site-packages"
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    return Path(venv_path) / "lib" / version / "site-packages"
+
+
+def requirements_key(requirements: str) -> str:
+    """Hash identifying a requirement set together with the interpreter it is installed for"""
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode())
+    digest.update(sys.version.encode())
+    digest.update(requirements.encode())
+    return digest.hexdigest()[:16]
+
+
+def pip_index_args(index_url: str = None, find_links: str = None) -> List[str]:
+    """
+    pip arguments selecting where packages come from
+
+    Args:
+        index_url (str): Package index to use instead of pip's configured one
+        find_links (str): Local directory of distributions; disables the index
+
+    Returns:
+        list: Arguments for `pip install`, `pip wheel` and friends
+    """
+    if find_links:
+        return ["--no-index", "--find-links", str(find_links)]
+    if index_url:
+        return ["--index-url", index_url]
+    return []
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _wheel_version(wheel: Path) -> tuple:
+    """Sort key for `pip-<version>-*.whl`: numeric release parts, so 24.0 sorts after 9.0.3"""
+    release = wheel.name.split("-")[1].split(".")
+    return tuple(int(re.match(r"\d*", part).group() or 0) for part in release)
+
+
+def _bundled_pip_wheel() -> Optional[Path]:
+    """The pip wheel shipped with `ensurepip`, if the interpreter has one"""
+    try:
+        import ensurepip
+    except ImportError:
+        return None
+    wheels = sorted((Path(ensurepip.__file__).parent / "_bundled").glob("pip-*.whl"), key=_wheel_version)
+    return wheels[-1] if wheels else None
+
+
+def cached_pip() -> Optional[Path]:
+    """
+    Extracted pip wheel in the Inventrix cache, unpacked once per pip version
+
+    The newest `pip-*.whl` dropped into `<cache>/pip` wins over the one bundled with
+    `ensurepip`. Extracted files are read-only because venvs hardlink them.
+
+    Returns:
+        Path: Directory to copy into site-packages, or None if no pip wheel is available
+    """
+    pip_cache = cache_dir("pip")
+    wheels = sorted(pip_cache.glob("pip-*.whl"), key=_wheel_version)
+    wheel = wheels[-1] if wheels else _bundled_pip_wheel()
+    if wheel is None:
+        return None
+
+    extracted = pip_cache / wheel.stem
+    if extracted.is_dir():
+        return extracted
+
+    temp = pip_cache / f".{wheel.stem}.{uuid.uuid4().hex[:8]}"
+    with zipfile.ZipFile(wheel) as archive:
+        archive.extractall(temp)
+    for path in temp.rglob("*"):
+        if path.is_file():
+            os.chmod(path, 0o444)
+    try:
+        os.rename(temp, extracted)
+    except OSError:
+        shutil.rmtree(temp, ignore_errors=True)  # A concurrent init got there first
+    return extracted
+
+
+def bootstrap_pip(venv_path: Path):
+    """
+    Make pip available in a venv created without it
+
+    The cached, already extracted pip wheel is hardlinked into site-packages and the
+    `pip` console scripts are written directly, which avoids the `ensurepip` subprocess.
+    Windows needs `.exe` launchers, and interpreters without a bundled wheel have no
+    cache to copy from; both fall back to `ensurepip`.
+
+    Args:
+        venv_path (Path): Virtual environment without pip
+    """
+    extracted = None if sys.platform == "win32" else cached_pip()
+    if extracted is None:
+        timings.run("ensurepip", [str(venv_python(venv_path)), "-m", "ensurepip", "--upgrade", "--default-pip"],
+                    check=True, stdout=subprocess.DEVNULL)
+        return
+
+    shutil.copytree(extracted, venv_site_packages(venv_path), copy_function=_link_or_copy,
+                    dirs_exist_ok=True)
+    script = PIP_SCRIPT.format(python=venv_python(venv_path))
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    for name in ("pip", f"pip{sys.version_info.major}", f"pip{version}"):
+        path = venv_bin_dir(venv_path) / name
+        path.write_text(script, encoding='utf-8')
+        os.chmod(path, 0o755)
+
+
+def create_venv(venv_path: Path, prompt: str = None, symlinks: Optional[bool] = None):
+    """
+    Create a virtual environment in-process with `venv.EnvBuilder`
+
+    The venv is built for the interpreter running Inventrix (no shell, no `python`
+    lookup on PATH) without pip, then pip is bootstrapped from the cache.
+
+    Args:
+        venv_path (Path): Where the venv is created
+        prompt (str): Shell prompt prefix (default: the venv directory name)
+        symlinks (bool): Symlink the interpreter instead of copying it
+            (default: True everywhere but Windows, like `python -m venv`)
+    """
+    if symlinks is None:
+        symlinks = os.name != "nt"
+    builder = venv.EnvBuilder(symlinks=symlinks, with_pip=False, prompt=prompt)
+    builder.create(str(venv_path))
+    bootstrap_pip(venv_path)
+
+
+def install_requirements(venv_path: Path, requirements_path: Path, cwd: Path = None, extra_args: List[str] = None):
+    """
+    Install a requirements file into a venv with the venv's own pip
+
+    Args:
+        venv_path (Path): Target virtual environment
+        requirements_path (Path): Requirements file to install
+        cwd (Path): Working directory for the subprocess
+        extra_args (list): Additional pip arguments, e.g. from `Wheelhouse.install_args`
+    """
+    pip = venv_bin_dir(venv_path) / ("pip.exe" if sys.platform == "win32" else "pip")
+    cmd = [str(pip), "install", "-r", str(requirements_path)] + list(extra_args or [])
+    timings.run("pip install", cmd, cwd=cwd, check=True)
+
+
+def relocate_venv(venv_path: Path, old_path: str):
+    """
+    Rewrite the absolute paths a venv embeds after it has been moved
+
+    `venv` and pip write the venv's location into the activate scripts, the shebang
+    of every console script and `pyvenv.cfg`. Those text files are replaced by rewritten
+    copies (never written through, in case they share an inode); binaries and symlinks
+    are left alone.
+
+    Args:
+        venv_path (Path): Current location of the venv
+        old_path (str): Absolute path the venv was created at
+    """
+    venv_path = Path(venv_path)
+    old = str(old_path).encode()
+    new = str(venv_path).encode()
+    if old == new:
+        return
+
+    candidates = [venv_path / "pyvenv.cfg"]
+    candidates.extend(venv_bin_dir(venv_path).iterdir())
+
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old not in data or b"\0" in data:
+            continue
+        temp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        temp.write_bytes(data.replace(old, new))
+        os.chmod(temp, path.stat().st_mode & 0o777 | 0o200)
+        os.replace(temp, path)
@@ -0,0 +1,169 @@
+"""
+Build fingerprints - everything a ComPy build depends on, so an unchanged project skips PyInstaller
+"""
+
+import ast
+import glob
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _module_file(root: Path, module: str) -> Optional[Path]:
+    """Source file of `module` below `root`, or None if it is not a local module"""
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.parent / f"{base.name}.py", base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_names(path: Path, module: Optional[str], is_package: bool) -> Set[str]:
+    """
+    Absolute names a source file imports, anywhere in the file
+
+    `from a import b` yields both `a` and `a.b`, since `b` may be a submodule.
+    """
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return set()  # Hashed all the same; PyInstaller reports the error
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if module is None:
+                    continue  # A relative import in the entry script fails at runtime anyway
+                package = module.split(".") if is_package else module.split(".")[:-1]
+                package = package[:len(package) - (node.level - 1)]
+                base = ".".join(package + ([node.module] if node.module else []))
+            else:
+                base = node.module
+            if base:
+                names.add(base)
+            names.update(f"{base}.{alias.name}" if base else alias.name
+                         for alias in node.names if alias.name != "*")
+    return names
+
+
+def local_modules(entry: Path, hidden_imports: Iterable[str] = ()) -> List[Path]:
+    """
+    The entry script and every local module it imports, transitively
+
+    Modules are looked up next to the entry script, where PyInstaller (and Python)
+    find them first. Parent packages of an imported module are included.
+
+    Args:
+        entry (Path): Entry script
+        hidden_imports (list): Extra module names PyInstaller is told to include
+
+    Returns:
+        list: Source files, entry script first
+    """
+    root = entry.parent
+    found = {entry: None}
+    queue = [(entry, None, False)]
+    pending = set(hidden_imports)
+
+    while queue or pending:
+        if queue:
+            path, module, is_package = queue.pop()
+            names = _imported_names(path, module, is_package)
+        else:
+            names, pending = pending, set()
+        for name in names:
+            parts = name.split(".")
+            for depth in range(1, len(parts) + 1):
+                submodule = ".".join(parts[:depth])
+                source = _module_file(root, submodule)
+                if source is not None and source not in found:
+                    found[source] = submodule
+                    queue.append((source, submodule, source.name == "__init__.py"))
+    return list(found)
+
+
+def _data_hashes(source: str) -> Dict[str, str]:
+    """Hashes of every file a `data_files` source (file, directory or glob) covers"""
+    paths = [Path(match) for match in sorted(glob.glob(source))] or [Path(source)]
+    hashes = {}
+    for path in paths:
+        if path.is_file():
+            hashes[path.as_posix()] = file_hash(path)
+        elif path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    file = Path(dirpath) / filename
+                    hashes[file.as_posix()] = file_hash(file)
+        else:
+            hashes[path.as_posix()] = "missing"
+    return hashes
+
+
+def installed_distributions() -> Dict[str, str]:
+    """Version of every distribution importable by this interpreter, by normalized name"""
+    from importlib.metadata import distributions
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            # The first one on sys.path is the one a build imports
+            installed.setdefault(name.lower().replace("_", "-").replace(".", "-"), dist.version)
+    return dict(sorted(installed.items()))
+
+
+def build_inputs(config: dict, pyinstaller_version: str,
+                 distributions: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Everything a build depends on, by name
+
+    Args:
+        config (dict): Resolved compy.json (defaults merged in)
+        pyinstaller_version (str): Version of the PyInstaller that will build
+        distributions (dict): Installed distribution versions (default: looked up
+            with `installed_distributions`)
+
+    Returns:
+        dict: `config`, `python` and `pyinstaller`, an `installed:<name>` version per
+        distribution, plus a content hash per source, data and icon file path
+    """
+    inputs = {
+        "config": hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest(),
+        "python": f"{sys.version} ({sys.executable})",
+        "pyinstaller": pyinstaller_version
+    }
+    if distributions is None:
+        distributions = installed_distributions()
+    inputs.update((f"installed:{name}", version) for name, version in distributions.items())
+    for path in local_modules(Path(config['entry']), config.get('hidden_imports', [])):
+        inputs[path.as_posix()] = file_hash(path)
+    for data in config.get('data_files', []):
+        inputs.update(_data_hashes(data.get('src') if isinstance(data, dict) else data))
+    if config.get('icon'):
+        inputs.update(_data_hashes(config['icon']))
+    return inputs
+
+
+def fingerprint(inputs: Dict[str, str]) -> str:
+    """Single hash over `build_inputs`"""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def changed_inputs(old: Dict[str, str], new: Dict[str, str]) -> List[str]:
+    """Names whose hash differs, including inputs that appeared or went away"""
+    return sorted(name for name in old.keys() | new.keys() if old.get(name) != new.get(name))
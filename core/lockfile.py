@@ -0,0 +1,94 @@
+"""
+Fully pinned, hash-checked requirement locks per template
+"""
+
+import json
+import os
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from core import timings
+from core.cache import cache_dir
+from core.environment import requirements_key
+
+
+class LockError(Exception):
+    """Raised when a requirement set cannot be turned into a lock"""
+
+
+class Lockfiles:
+    """
+    Records the exact distributions a template's requirement set resolves to
+
+    `lock` asks pip to resolve the requirements without installing anything
+    (`pip install --dry-run --report`) and writes one `name==version --hash=...` line per
+    resolved distribution. Installing that file with `--no-deps` skips dependency
+    resolution entirely, and because the file is identical on every init the package
+    store and venv pool can reuse what they built for it.
+
+    Locks are resolved for the current interpreter and platform.
+
+    Args:
+        root (Path): Lock directory (default: `<cache>/locks`)
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else cache_dir("locks")
+
+    def path_for(self, requirements: str) -> Path:
+        """Location of the lock for a requirement set"""
+        return self.root / f"{requirements_key(requirements)}.lock"
+
+    def load(self, requirements: str) -> Optional[str]:
+        """Lock content for a requirement set, or None if it was never locked"""
+        path = self.path_for(requirements)
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+
+    def lock(self, template: str, requirements: str, index_args: List[str] = None) -> str:
+        """
+        Resolve a requirement set and store the pinned result
+
+        Args:
+            template (str): Template the requirements belong to (recorded in the header)
+            requirements (str): requirements.txt content
+            index_args (list): pip arguments selecting the package source
+
+        Returns:
+            str: Lock content
+        """
+        with tempfile.TemporaryDirectory(prefix="inventrix-lock-") as tmp:
+            requirements_path = Path(tmp) / "requirements.txt"
+            report_path = Path(tmp) / "report.json"
+            requirements_path.write_text(requirements, encoding='utf-8')
+            cmd = [sys.executable, "-m", "pip", "install", "--dry-run", "--ignore-installed",
+                   "--quiet", "--report", str(report_path), "-r", str(requirements_path)]
+            result = timings.run("pip resolve", cmd + list(index_args or []), capture_output=True, text=True)
+            if result.returncode != 0:
+                lines = (result.stderr or result.stdout).strip().splitlines()
+                raise LockError(lines[-1] if lines else f"pip exited with {result.returncode}")
+            with open(report_path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+
+        lines = [
+            f"# Locked by Inventrix for {template}",
+            f"# Python {sys.version_info.major}.{sys.version_info.minor} on {sys.platform}",
+            "# Install with: pip install --no-deps -r requirements.lock",
+            ""
+        ]
+        for item in sorted(report["install"], key=lambda i: i["metadata"]["name"].lower()):
+            name = item["metadata"]["name"]
+            hashes = item["download_info"].get("archive_info", {}).get("hashes", {})
+            if "sha256" not in hashes:
+                raise LockError(f"{name} has no archive hash ({item['download_info']['url']})")
+            lines.append(f"{name}=={item['metadata']['version']} --hash=sha256:{hashes['sha256']}")
+        content = "\n".join(lines) + "\n"
+
+        temp = self.root / f".{uuid.uuid4().hex[:8]}"
+        temp.write_text(content, encoding='utf-8')
+        os.replace(temp, self.path_for(requirements))
+        return content
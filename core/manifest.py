@@ -0,0 +1,118 @@
+"""
+Project manifest - what Inventrix generated in a project, so a re-run only touches what changed
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of rendered file content"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ProjectManifest:
+    """
+    Record of a generated project in `<project>/.inventrix/manifest.json`
+
+    The manifest keeps the settings and template variables a project was rendered with
+    (including the Django secret key, so re-rendering is deterministic), the hash of the
+    requirement set its venv was provisioned for, and the content hash of every
+    generated file. Comparing those hashes with the files on disk tells apart files
+    the template changed from files the user edited.
+
+    Args:
+        project_path (Path): Project root
+    """
+
+    PATH = ".inventrix/manifest.json"
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        self.path = self.project_path / self.PATH
+        self.data: Dict = {}
+
+    def load(self) -> Dict:
+        """Read the manifest, or an empty dict if the project has none"""
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        return self.data
+
+    @staticmethod
+    def render(files: Dict[str, str], directories: Iterable[str], **settings) -> str:
+        """
+        Manifest content for a set of generated files
+
+        Args:
+            files (dict): Content hash by project-relative path
+            directories (iterable): Generated directories
+            settings: template, profile, locked, description, variables, requirements_hash
+
+        Returns:
+            str: JSON text
+        """
+        data = {**settings, "generated": time.time(), "directories": sorted(directories),
+                "files": dict(sorted(files.items()))}
+        return json.dumps(data, indent=2) + "\n"
+
+    def save(self, files: Dict[str, str], directories: Iterable[str], **settings):
+        """Atomically replace the manifest"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f".manifest.{uuid.uuid4().hex[:8]}")
+        temp.write_text(self.render(files, directories, **settings), encoding='utf-8')
+        os.replace(temp, self.path)
+
+    def disk_hash(self, relpath: str) -> Optional[str]:
+        """Content hash of a project file as it is now, or None if it is missing"""
+        path = self.project_path / relpath
+        try:
+            # Text mode undoes platform newline translation, matching the rendered content
+            with open(path, 'r', encoding='utf-8') as f:
+                return content_hash(f.read())
+        except FileNotFoundError:
+            return None
+        except (UnicodeDecodeError, IsADirectoryError):
+            return "modified"
+
+    def diff(self, rendered: Dict[str, str]) -> Dict[str, list]:
+        """
+        Sort freshly rendered files by what an update must do with them
+
+        - write: new to the template, or changed by it and untouched on disk
+        - unchanged: the file on disk already has the rendered content
+        - kept: edited or deleted by the user, or not generated by Inventrix; left alone
+        - stale: generated before, no longer part of the template and untouched on disk
+
+        Args:
+            rendered (dict): Rendered content by project-relative path
+
+        Returns:
+            dict: Lists of paths under the keys above
+        """
+        recorded = self.data.get("files", {})
+        changes = {"write": [], "unchanged": [], "kept": [], "stale": []}
+
+        for relpath, content in rendered.items():
+            new = content_hash(content)
+            current = self.disk_hash(relpath)
+            if current == new:
+                changes["unchanged"].append(relpath)
+            elif current is None and relpath not in recorded:
+                changes["write"].append(relpath)
+            elif current is not None and current == recorded.get(relpath):
+                changes["write"].append(relpath)
+            else:
+                changes["kept"].append(relpath)
+
+        for relpath, old in recorded.items():
+            if relpath not in rendered and self.disk_hash(relpath) == old:
+                changes["stale"].append(relpath)
+
+        return changes
@@ -0,0 +1,336 @@
+"""
+Content-addressed store of installed distributions shared by all generated venvs
+"""
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
+
+from core.cache import cache_dir
+from core.environment import venv_bin_dir, venv_python, venv_site_packages
+
+# ioctl request number of FICLONE on Linux (copy-on-write clone of a whole file)
+FICLONE = 0x40049409
+
+# Opening of pip's console-script header for interpreters a #! line cannot name
+SH_HEADER = b"#!/bin/sh\n'''exec' "
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone on filesystems that support it (btrfs, XFS); False elsewhere"""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        if dst.exists():
+            dst.unlink()
+        return False
+
+
+def script_header(python: str) -> bytes:
+    """
+    Interpreter header pip writes for a console script
+
+    A plain `#!` line, unless the interpreter path contains spaces or the line would
+    exceed the kernel's 127-byte limit; then `/bin/sh` re-executes the script with it.
+    """
+    if " " not in python and len(python) + 3 <= 127:
+        return f"#!{python}\n".encode()
+    executable = f'"{python}"' if " " in python else python
+    return SH_HEADER + f'{executable} "$0" "$@"\n'.encode() + b"' '''\n"
+
+
+def _split_header(data: bytes):
+    """(interpreter header, rest) of a console script, or (None, data) if it has none"""
+    if data.startswith(SH_HEADER):
+        lines = data.split(b"\n", 3)
+        if len(lines) == 4 and lines[2] == b"' '''":
+            return b"\n".join(lines[:3]) + b"\n", lines[3]
+    first, newline, rest = data.partition(b"\n")
+    if data.startswith(b"#!") and b"python" in first and newline:
+        return first + newline, rest
+    return None, data
+
+
+def link_or_copy(src: Path, dst: Path):
+    """Hardlink `src` to `dst`, falling back to a reflink and finally to a plain copy"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        if not _reflink(src, dst):
+            shutil.copy2(src, dst)
+
+
+class PackageStore:
+    """
+    Global store of installed files, deduplicated by content hash (similar to pnpm)
+
+    Layout below the store root:
+
+        objects/<aa>/<sha256>   Read-only file contents, hardlinked into venvs
+        dists/<key>.json        Files of one installed distribution
+        envs/<key>.json         Distributions a requirement set installed
+
+    After a regular pip install, `ingest` moves every installed file into the store and
+    replaces it with a hardlink. The next venv with the same requirement set is filled by
+    `populate`, which links the recorded distributions instead of running pip.
+    Console scripts (files installed into the venv's bin directory) are the exception:
+    their header names the venv interpreter, so they are copied and rewritten instead of
+    linked. Other files outside site-packages, such as `share/jupyter/...` data files,
+    are linked at the same location relative to site-packages. On Windows scripts are
+    `.exe` launchers with the path embedded in binary data, so Creator does not use the
+    store there.
+
+    Args:
+        root (Path): Store directory (default: `<cache>/store`)
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else cache_dir("store")
+        self.objects = self.root / "objects"
+        self.dists = self.root / "dists"
+        self.envs = self.root / "envs"
+        for path in (self.objects, self.dists, self.envs):
+            path.mkdir(parents=True, exist_ok=True)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest
+
+    def _store_object(self, path: Path, link: bool = True) -> str:
+        """Add a file's content to the store and return its hash; `link=False` copies it"""
+        digest = _hash_file(path)
+        target = self._object_path(digest)
+        if target.exists():
+            return digest
+
+        target.parent.mkdir(exist_ok=True)
+        temp = target.with_name(f".{digest}.{uuid.uuid4().hex[:8]}")
+        if link:
+            link_or_copy(path, temp)
+        else:
+            shutil.copyfile(path, temp)
+        os.chmod(temp, os.stat(temp).st_mode & ~0o222)  # Shared inode: never writable
+        os.replace(temp, target)
+        return digest
+
+    def _dedupe(self, path: Path, digest: str):
+        """Replace an installed file with a link to its store object"""
+        target = self._object_path(digest)
+        try:
+            if os.path.samefile(path, target):
+                return
+        except OSError:
+            return
+        temp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        try:
+            os.link(target, temp)
+        except OSError:
+            return  # Store on another filesystem: keep the venv's own copy
+        os.replace(temp, path)
+
+    @staticmethod
+    def _read_metadata(dist_info: Path) -> Dict[str, str]:
+        fields = {}
+        with open(dist_info / "METADATA", 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if not line.strip():
+                    break
+                key, _, value = line.partition(":")
+                if key in ("Name", "Version"):
+                    fields[key.lower()] = value.strip()
+        tags = []
+        wheel = dist_info / "WHEEL"
+        if wheel.exists():
+            tags = [line.split(":", 1)[1].strip() for line in wheel.read_text().splitlines()
+                    if line.startswith("Tag:")]
+        fields["tags"] = ",".join(sorted(tags))
+        return fields
+
+    def _dist_key(self, metadata: Dict[str, str]) -> str:
+        digest = hashlib.sha256(f"{metadata['tags']}|{sys.implementation.cache_tag}".encode())
+        name = metadata['name'].lower().replace("-", "_")
+        return f"{name}-{metadata['version']}-{digest.hexdigest()[:12]}"
+
+    def ingest(self, venv_path: Path) -> Dict[str, str]:
+        """
+        Move every distribution installed in a venv into the store
+
+        Args:
+            venv_path (Path): Virtual environment after pip has run
+
+        Returns:
+            dict: Store key of each ingested distribution, by `.dist-info` directory name
+        """
+        site_packages = venv_site_packages(venv_path)
+        bin_dir = os.path.normpath(venv_bin_dir(venv_path))
+        keys = {}
+        for dist_info in sorted(site_packages.glob("*.dist-info")):
+            record = dist_info / "RECORD"
+            if not record.exists() or not (dist_info / "METADATA").exists():
+                continue
+
+            metadata = self._read_metadata(dist_info)
+            key = self._dist_key(metadata)
+            files = {}
+            with open(record, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.reader(f):
+                    if not row:
+                        continue
+                    relpath = PurePosixPath(row[0]).as_posix()
+                    path = site_packages / relpath
+                    if not path.is_file() or path.is_symlink():
+                        continue
+                    # Console scripts stay the venv's own files: relocating a venv rewrites them
+                    script = os.path.dirname(os.path.normpath(path)) == bin_dir
+                    digest = self._store_object(path, link=not script)
+                    if not script:
+                        self._dedupe(path, digest)
+                    files[relpath] = {
+                        "hash": digest,
+                        "mode": path.stat().st_mode & 0o777,
+                        "script": script
+                    }
+
+            # The interpreter the scripts were written for, replaced when they are populated
+            manifest = {"name": metadata['name'], "version": metadata['version'],
+                        "python": str(venv_python(venv_path)), "files": files}
+            temp = self.dists / f".{key}.{uuid.uuid4().hex[:8]}"
+            temp.write_text(json.dumps(manifest), encoding='utf-8')
+            os.replace(temp, self.dists / f"{key}.json")
+            keys[dist_info.name] = key
+        return keys
+
+    def record_env(self, env_key: str, dist_keys: List[str]):
+        """Remember which distributions a requirement set installs"""
+        temp = self.envs / f".{env_key}.{uuid.uuid4().hex[:8]}"
+        temp.write_text(json.dumps({"dists": sorted(dist_keys)}), encoding='utf-8')
+        os.replace(temp, self.envs / f"{env_key}.json")
+
+    def lookup_env(self, env_key: str) -> Optional[List[str]]:
+        """Distributions recorded for a requirement set, or None if the store cannot provide them"""
+        env_file = self.envs / f"{env_key}.json"
+        if not env_file.exists():
+            return None
+        dist_keys = json.loads(env_file.read_text(encoding='utf-8'))["dists"]
+        if not all((self.dists / f"{key}.json").exists() for key in dist_keys):
+            return None
+        return dist_keys
+
+    def populate(self, venv_path: Path, dist_keys: List[str]) -> int:
+        """
+        Fill a fresh venv with recorded distributions
+
+        Distributions already present in the venv (pip, setuptools) are left alone.
+
+        Args:
+            venv_path (Path): Target virtual environment
+            dist_keys (list): Keys returned by `lookup_env`
+
+        Returns:
+            int: Number of files placed
+        """
+        site_packages = venv_site_packages(venv_path)
+        present = {p.name for p in site_packages.glob("*.dist-info")}
+        python = str(venv_python(venv_path))
+        header = script_header(python)
+        placed = 0
+
+        for key in dist_keys:
+            manifest = json.loads((self.dists / f"{key}.json").read_text(encoding='utf-8'))
+            if any(PurePosixPath(p).parts[0] in present for p in manifest["files"]):
+                continue
+
+            old_python = manifest.get("python")
+            for relpath, entry in manifest["files"].items():
+                source = self._object_path(entry["hash"])
+                # Scripts and data files (../../../bin/..., ../../../share/...) keep their place
+                dest = Path(os.path.normpath(site_packages / relpath))
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                if dest.exists():
+                    dest.unlink()
+
+                if entry["script"]:
+                    old_header, body = _split_header(source.read_bytes())
+                    if old_python:
+                        body = body.replace(old_python.encode(), python.encode())
+                    dest.write_bytes(body if old_header is None else header + body)
+                    os.chmod(dest, entry["mode"] | 0o200)
+                else:
+                    link_or_copy(source, dest)
+                placed += 1
+        return placed
+
+    def gc(self) -> Dict[str, int]:
+        """
+        Reclaim space from distributions no venv links to any more
+
+        A distribution is in use while at least one of its linked objects has a link
+        count above one (the store's own entry). Unused distributions are dropped, then
+        every object no remaining distribution references is deleted.
+
+        Returns:
+            dict: Distributions and objects removed, and bytes freed
+        """
+        removed_dists = 0
+        referenced = set()
+        for manifest_path in list(self.dists.glob("*.json")):
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+            linked = [e["hash"] for e in manifest["files"].values() if not e["script"]]
+            in_use = False
+            for digest in linked:
+                try:
+                    if os.stat(self._object_path(digest)).st_nlink > 1:
+                        in_use = True
+                        break
+                except FileNotFoundError:
+                    continue
+            if in_use:
+                referenced.update(e["hash"] for e in manifest["files"].values())
+            else:
+                manifest_path.unlink()
+                removed_dists += 1
+
+        removed_objects = 0
+        freed = 0
+        for obj in list(self.objects.glob("*/*")):
+            if obj.name in referenced:
+                continue
+            stat = obj.stat()
+            if stat.st_nlink == 1:
+                freed += stat.st_size
+            obj.unlink()
+            removed_objects += 1
+
+        # Env records pointing at dropped distributions are stale
+        for env_file in list(self.envs.glob("*.json")):
+            if self.lookup_env(env_file.stem) is None:
+                env_file.unlink()
+
+        return {"dists": removed_dists, "objects": removed_objects, "bytes": freed}
+
+    def status(self) -> Dict[str, int]:
+        """Number of distributions, objects and bytes held by the store"""
+        objects = list(self.objects.glob("*/*"))
+        return {
+            "dists": sum(1 for _ in self.dists.glob("*.json")),
+            "objects": len(objects),
+            "bytes": sum(p.stat().st_size for p in objects)
+        }
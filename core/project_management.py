@@ -4,14 +4,16 @@ ComPy - A simple Python to executable compiler
 Usage: python compy.py [command] [options]
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
-import subprocess
-import shutil
-import argparse
-from pathlib import Path
-from typing import Dict, List, Optional
+
+from core import timings
+
+# subprocess, shutil and pathlib are imported by the methods that run or clean a build:
+# `inventrix config` only reads compy.json and should not pay for them
 
 class ComPy:
     def __init__(self):
@@ -26,28 +28,90 @@ class ComPy:
             "data_files": [],
             "exclude_modules": [],
             "upx": False,
-            "clean": True,
+            # True passes --clean to every build; otherwise only a retry after a failed cached build does
+            "clean": False,
             "dist_dir": "dist",
-            "build_dir": "build"
+            # None keeps PyInstaller's work files in the managed build cache (see BuildCache)
+            "build_dir": None
         }
         self.config = {}
+        # Fingerprint of the last successful build, see `build`
+        self.stamp_file = os.path.join(".compy", "build.json")
+        self.pyinstaller_version = None
+        # Installed distributions by name, part of the build fingerprint
+        self.distributions = {}
     
     def check_pyinstaller(self) -> bool:
-        """Check if PyInstaller is installed"""
+        """
+        Check if PyInstaller is installed for this interpreter (and remember its version)
+
+        Looked up with importlib instead of starting `pyinstaller --version`. The result,
+        together with the versions of all installed distributions, is cached in the
+        Inventrix cache (`pyinstaller-detect.json`), keyed by the interpreter, its import
+        path and the mtimes of its site-packages directories, which change whenever a
+        package is installed, upgraded or removed.
+        """
+        import hashlib
+        import importlib.util
+        import site
+        from core.cache import cache_dir
+        from core.fingerprint import installed_distributions
+        
+        site_dirs = site.getsitepackages() + [site.getusersitepackages()]
+        identity = json.dumps({
+            "python": f"{sys.version} ({sys.executable})",
+            "path": sys.path,
+            "site": {d: os.stat(d).st_mtime_ns for d in site_dirs if os.path.isdir(d)}
+        }, sort_keys=True)
+        key = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+        
+        stamp_path = cache_dir() / "pyinstaller-detect.json"
         try:
-            subprocess.run(["pyinstaller", "--version"], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+            with open(stamp_path, 'r', encoding='utf-8') as f:
+                stamps = json.load(f)
+        except (OSError, ValueError):
+            stamps = {}
+        stamp = stamps.get(sys.executable, {})
+        if stamp.get("key") == key and "distributions" in stamp:
+            self.pyinstaller_version = stamp["version"]
+            self.distributions = stamp["distributions"]
+            return stamp["version"] is not None
+        
+        with timings.span("find_spec"):
+            if importlib.util.find_spec("PyInstaller") is None:
+                version = None
+            else:
+                from importlib.metadata import PackageNotFoundError, version as dist_version
+                try:
+                    version = dist_version("pyinstaller")
+                except PackageNotFoundError:
+                    version = "unknown"  # Importable without metadata, e.g. from a source checkout
+        with timings.span("distributions"):
+            distributions = installed_distributions()
+        
+        stamps[sys.executable] = {"key": key, "version": version, "distributions": distributions}
+        temp = stamp_path.with_name(f".pyinstaller-detect.{os.getpid()}.json")
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(stamps, f, indent=2)
+            os.replace(temp, stamp_path)
+        except OSError:
+            pass  # Detection still worked; the next build looks PyInstaller up again
+        
+        self.pyinstaller_version = version
+        self.distributions = distributions
+        return version is not None
     
     def install_pyinstaller(self):
         """Install PyInstaller"""
         print("📦 PyInstaller not found. Installing...")
+        import subprocess
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"],
-                         check=True)
+            timings.run("pip install", [sys.executable, "-m", "pip", "install", "pyinstaller"],
+                        check=True)
             print("✅ PyInstaller installed successfully!")
+            import importlib
+            importlib.invalidate_caches()  # So check_pyinstaller finds the new package
         except subprocess.CalledProcessError:
             print("❌ Failed to install PyInstaller. Please install manually:")
             print("   pip install pyinstaller")
@@ -93,7 +157,7 @@ class ComPy:
         print(f"📝 Edit this file to customize your build settings")
         print(f"🔨 Run 'python compy.py build' to compile your project")
     
-    def load_config(self) -> Dict:
+    def load_config(self) -> dict:
         """Load configuration from compy.json"""
         if not os.path.exists(self.config_file):
             print(f"❌ {self.config_file} not found!")
@@ -108,9 +172,10 @@ class ComPy:
         final_config.update(config)
         return final_config
     
-    def build_pyinstaller_command(self, config: Dict) -> List[str]:
-        """Build PyInstaller command from config"""
-        cmd = ["pyinstaller"]
+    def build_pyinstaller_command(self, config: dict, workpath=None, clean: bool = False) -> list[str]:
+        """Build PyInstaller command from config, optionally with a given work directory and --clean"""
+        # The interpreter running ComPy, not whichever `pyinstaller` script is first on PATH
+        cmd = [sys.executable, "-m", "PyInstaller"]
         
         # Basic options
         if config['onefile']:
@@ -128,7 +193,9 @@ class ComPy:
         
         # Directories
         cmd.extend(["--distpath", config['dist_dir']])
-        cmd.extend(["--workpath", config['build_dir']])
+        workpath = workpath or config['build_dir']
+        if workpath:
+            cmd.extend(["--workpath", str(workpath)])
         
         # Hidden imports
         for imp in config.get('hidden_imports', []):
@@ -152,7 +219,7 @@ class ComPy:
             cmd.append("--noupx")
         
         # Clean
-        if config.get('clean', True):
+        if clean or config.get('clean', False):
             cmd.append("--clean")
         
         # Entry point
@@ -160,22 +227,114 @@ class ComPy:
         
         return cmd
     
+    def executable_path(self, config: dict):
+        """Path of the built executable (inside the application folder for one-dir builds)"""
+        from pathlib import Path
+        
+        exe_name = config['name']
+        if sys.platform == 'win32':
+            exe_name += '.exe'
+        if config['onefile']:
+            return Path(config['dist_dir']) / exe_name
+        return Path(config['dist_dir']) / config['name'] / exe_name
+    
+    def _load_stamp(self) -> dict:
+        try:
+            with open(self.stamp_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_stamp(self, inputs: dict, exe_path):
+        from core.fingerprint import fingerprint
+        
+        stat = exe_path.stat()
+        stamp = {
+            "fingerprint": fingerprint(inputs),
+            "inputs": inputs,
+            "executable": {"path": str(exe_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        }
+        os.makedirs(os.path.dirname(self.stamp_file), exist_ok=True)
+        temp = f"{self.stamp_file}.{os.getpid()}"
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(stamp, f, indent=2)
+        os.replace(temp, self.stamp_file)
+    
+    def up_to_date(self, config: dict, inputs: dict) -> bool:
+        """
+        True if the last successful build used exactly these inputs and its
+        executable is still the one that build produced
+        
+        Otherwise prints why a build is needed.
+        """
+        from core.fingerprint import changed_inputs, fingerprint
+        
+        stamp = self._load_stamp()
+        if not stamp:
+            return False
+        
+        if stamp["fingerprint"] != fingerprint(inputs):
+            changed = changed_inputs(stamp.get("inputs", {}), inputs)
+            shown = ", ".join(changed[:5]) + (f" and {len(changed) - 5} more" if len(changed) > 5 else "")
+            print(f"🔁 Changed since the last build: {shown}")
+            return False
+        
+        recorded = stamp["executable"]
+        exe_path = self.executable_path(config)
+        try:
+            stat = exe_path.stat()
+        except OSError:
+            print(f"🔁 Executable missing: {exe_path}")
+            return False
+        if recorded["path"] != str(exe_path) or (stat.st_size, stat.st_mtime_ns) != (recorded["size"], recorded["mtime_ns"]):
+            print(f"🔁 Executable changed since the last build: {exe_path}")
+            return False
+        return True
+    
     def build(self, args):
         """Build the executable"""
         # Check PyInstaller
-        if not self.check_pyinstaller():
-            self.install_pyinstaller()
+        with timings.span("check_pyinstaller"):
+            installed = self.check_pyinstaller()
+        if not installed:
+            with timings.span("install_pyinstaller"):
+                self.install_pyinstaller()
+            with timings.span("check_pyinstaller"):
+                self.check_pyinstaller()
         
         # Load config
-        config = self.load_config()
+        with timings.span("load_config"):
+            config = self.load_config()
         
         # Check entry point exists
         if not os.path.exists(config['entry']):
             print(f"❌ Entry point '{config['entry']}' not found!")
             sys.exit(1)
         
+        import subprocess
+        from pathlib import Path
+        from core.fingerprint import build_inputs
+        
+        # Skip PyInstaller entirely when nothing the build depends on changed
+        with timings.span("fingerprint"):
+            inputs = build_inputs(config, self.pyinstaller_version, self.distributions)
+            fresh = not getattr(args, 'force', False) and self.up_to_date(config, inputs)
+        if fresh:
+            print(f"✅ Up to date: {self.executable_path(config)} (nothing changed since the last build)")
+            return
+        
+        # Work directory: the project's own build_dir, or a managed cache entry reused across builds
+        build_cache = None
+        if config['build_dir']:
+            workpath = Path(config['build_dir'])
+        else:
+            from core.build_cache import BuildCache
+            build_cache = BuildCache()
+            workpath = build_cache.acquire(Path.cwd(), config, self.pyinstaller_version)
+        reused = workpath.is_dir() and any(workpath.iterdir())
+        
         # Build command
-        cmd = self.build_pyinstaller_command(config)
+        cmd = self.build_pyinstaller_command(config, workpath)
         
         print("🔨 Building executable...")
         print(f"📄 Command: {' '.join(cmd)}")
@@ -183,25 +342,44 @@ class ComPy:
         
         try:
             # Run PyInstaller
-            result = subprocess.run(cmd, check=True)
+            try:
+                result = timings.run("pyinstaller", cmd, check=True)
+            except subprocess.CalledProcessError:
+                if not reused or "--clean" in cmd:
+                    raise
+                # A stale or damaged work cache is the one failure a clean rebuild can fix
+                print("=" * 50)
+                print("⚠️  Build failed with the cached work files; retrying once from a clean cache...")
+                if build_cache:
+                    build_cache.reset(workpath)
+                cmd = self.build_pyinstaller_command(config, workpath, clean=True)
+                result = timings.run("pyinstaller --clean", cmd, check=True)
+            
+            if build_cache:
+                with timings.span("evict"):
+                    build_cache.evict(keep=workpath)
             
             print("=" * 50)
             print("✅ Build successful!")
             
             # Find executable
-            dist_path = Path(config['dist_dir'])
-            if config['onefile']:
-                exe_name = config['name']
-                if sys.platform == 'win32':
-                    exe_name += '.exe'
-                exe_path = dist_path / exe_name
-            else:
-                exe_path = dist_path / config['name']
+            with timings.span("locate"):
+                dist_path = Path(config['dist_dir'])
+                if config['onefile']:
+                    exe_name = config['name']
+                    if sys.platform == 'win32':
+                        exe_name += '.exe'
+                    exe_path = dist_path / exe_name
+                else:
+                    exe_path = dist_path / config['name']
+                found = exe_path.exists()
             
-            if exe_path.exists():
+            if found:
                 print(f"📦 Executable: {exe_path}")
                 if not config['onefile']:
                     print(f"📂 Application folder: {exe_path}")
+                if self.executable_path(config).exists():
+                    self._save_stamp(inputs, self.executable_path(config))
             
         except subprocess.CalledProcessError:
             print("\n❌ Build failed!")
@@ -209,15 +387,24 @@ class ComPy:
     
     def clean(self, args):
         """Clean build artifacts"""
+        import shutil
+        
         config = self.load_config()
         
         print("🧹 Cleaning build artifacts...")
         
         paths_to_remove = [
-            config['build_dir'],
             config['dist_dir'],
-            f"{config['name']}.spec"
+            f"{config['name']}.spec",
+            os.path.dirname(self.stamp_file)
         ]
+        if config['build_dir']:
+            paths_to_remove.insert(0, config['build_dir'])
+        else:
+            from core.build_cache import BuildCache
+            removed = BuildCache().clear(project=os.getcwd())
+            if removed:
+                print(f"🗑️  Removed {removed} cached work director{'y' if removed == 1 else 'ies'}")
         
         for path in paths_to_remove:
             if os.path.exists(path):
@@ -225,29 +412,21 @@ class ComPy:
                     os.remove(path)
                     print(f"🗑️  Removed {path}")
                 else:
-                    shutil.rmtree(path)
+                    with timings.span("remove", path=path):
+                        shutil.rmtree(path)
                     print(f"🗑️  Removed {path}/")
         
         print("✅ Clean complete!")
     
     def run(self, args):
-        """Build and run the executable"""
-        self.build(args)
+        """Build (unless up to date) and run the executable"""
+        with timings.span("build"):
+            self.build(args)
         
         config = self.load_config()
         
         # Determine executable path
-        dist_path = Path(config['dist_dir'])
-        if config['onefile']:
-            exe_name = config['name']
-            if sys.platform == 'win32':
-                exe_name += '.exe'
-            exe_path = dist_path / exe_name
-        else:
-            exe_name = config['name']
-            if sys.platform == 'win32':
-                exe_name += '.exe'
-            exe_path = dist_path / config['name'] / exe_name
+        exe_path = self.executable_path(config)
         
         if not exe_path.exists():
             print(f"❌ Executable not found: {exe_path}")
@@ -257,7 +436,7 @@ class ComPy:
         print("=" * 50)
         
         try:
-            subprocess.run([str(exe_path)])
+            timings.run("execute", [str(exe_path)])
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted")
     
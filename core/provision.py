@@ -0,0 +1,197 @@
+"""
+Environment provisioning status and the detached worker that runs it in the background
+
+Usage (internal): python -m core.provision <project path>
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+from core import timings
+
+STATES = ("queued", "installing", "ready", "failed")
+
+
+class ProvisionStatus:
+    """
+    Progress of a project's venv creation and installation
+
+    The status lives in `<project>/.inventrix/status.json` next to the worker log
+    `provision.log`, and is rewritten atomically on every change so `inventrix status`
+    never reads a partial file. Phases may run on several threads at once. While
+    `persist` is False (the project directory does not exist yet) changes are only kept
+    in memory until `flush` is called.
+
+    Args:
+        project_path (Path): Project root
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        self.directory = self.project_path / ".inventrix"
+        self.path = self.directory / "status.json"
+        self.log_path = self.directory / "provision.log"
+        self.pid_path = self.directory / "worker.pid"
+        self.data: Dict = {}
+        self.persist = True
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict:
+        """Read the status file, or an empty dict if the project has none"""
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        return self.data
+
+    def _save(self):
+        with self._lock:
+            self.data["updated"] = time.time()
+            if not self.persist:
+                return
+            self.directory.mkdir(exist_ok=True)
+            temp = self.directory / f".status.{uuid.uuid4().hex[:8]}"
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(temp, self.path)
+
+    def flush(self):
+        """Start writing to disk and save everything recorded so far"""
+        self.persist = True
+        self._save()
+
+    def start(self, **settings):
+        """Record a queued provisioning run with the settings the worker needs"""
+        self.data = {"state": "queued", "created": time.time(), "phases": {}, **settings}
+        self.pid_path.unlink(missing_ok=True)  # From an earlier background run
+        self._save()
+
+    def set_state(self, state: str, error: Optional[str] = None):
+        """Move to one of `STATES`"""
+        with self._lock:
+            self.data["state"] = state
+            if error:
+                self.data["error"] = error
+        self._save()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time one provisioning phase (venv, install, ...), also as a timings span"""
+        started = time.time()
+        with self._lock:
+            self.data.setdefault("phases", {})[name] = {"started": started, "seconds": None}
+        self._save()
+        try:
+            with timings.span(name):
+                yield
+        finally:
+            with self._lock:
+                self.data["phases"][name]["seconds"] = round(time.time() - started, 3)
+            self._save()
+
+    def worker_pid(self) -> Optional[int]:
+        """
+        Process id of the background worker
+
+        The worker records its pid in the status once it runs; until then the pid
+        `spawn_worker` wrote to `worker.pid` is used, so a worker that dies on startup
+        is still noticed.
+        """
+        pid = self.data.get("pid")
+        if pid:
+            return pid
+        try:
+            return int(self.pid_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def worker_alive(self) -> bool:
+        """True if the recorded background worker process still exists"""
+        pid = self.worker_pid()
+        if not pid or sys.platform == "win32":
+            return bool(pid)
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def spawn_worker(self) -> int:
+        """
+        Start a detached `python -m core.provision` for this project
+
+        The worker outlives the `init` process, writes its output to `provision.log`
+        and reports progress through this status file. It runs from `.inventrix/`: with
+        `-m` the working directory comes first on `sys.path`, and a project package named
+        like an Inventrix one (the Django template's `core`) would shadow it.
+
+        Returns:
+            int: Worker process id
+        """
+        inventrix_root = Path(__file__).resolve().parent.parent
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(inventrix_root), env.get("PYTHONPATH")]))
+        env["PYTHONUNBUFFERED"] = "1"  # Keep the log in step with progress
+
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+
+        self.directory.mkdir(exist_ok=True)
+        with open(self.log_path, 'ab') as log, timings.span("spawn_worker") as current:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "core.provision", str(self.project_path)],
+                cwd=self.directory,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                **kwargs
+            )
+            current.set(worker_pid=process.pid)
+        # Not saved in the status: that could overwrite the worker's first update
+        temp = self.directory / f".worker.{uuid.uuid4().hex[:8]}"
+        temp.write_text(str(process.pid), encoding='utf-8')
+        os.replace(temp, self.pid_path)
+        return process.pid
+
+
+def main(argv=None):
+    """Worker entry point: provision the project named on the command line"""
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0]).resolve()
+    status = ProvisionStatus(project_path)
+    settings = status.load()
+    status.data["pid"] = os.getpid()
+
+    # Imported here: core.creation imports this module
+    from core.creation import Creator
+
+    creator = Creator(
+        name=project_path.name,
+        description="",
+        template=settings["template"],
+        base_dir=str(project_path.parent),
+        locked=settings.get("locked", False),
+        profile=settings["profile"]
+    )
+    try:
+        creator.provision_environment(status)
+    except Exception:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Requirements compiler - turns loosely written requirement blocks into a minimal, valid set
+"""
+
+import re
+import sys
+from typing import Dict, List
+
+# A comment starts at '#' at the beginning of a line or after whitespace (pip's own rule),
+# so URL fragments such as '#egg=' survive
+COMMENT = re.compile(r"(^|\s)#.*$")
+NAME = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+SPECIFIER = re.compile(r"[<>=!~;@\[]")
+
+# Import names that are commonly written where the distribution name belongs
+IMPORT_ALIASES = {
+    "yaml": "PyYAML",
+    "bs4": "beautifulsoup4",
+    "cv2": "opencv-python",
+    "sklearn": "scikit-learn",
+    "PIL": "Pillow",
+    "dotenv": "python-dotenv",
+}
+
+# Empty before Python 3.10, where nothing can be classified as stdlib
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ()))
+
+
+def canonical_name(name: str) -> str:
+    """PEP 503 normalised project name"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def is_stdlib(name: str) -> bool:
+    """True if a requirement names a standard library module (`os`, `concurrent.futures`)"""
+    return name in STDLIB_MODULES or ("." in name and name.split(".")[0] in STDLIB_MODULES)
+
+
+def compile_requirements(*blocks: str) -> Dict:
+    """
+    Compile requirement blocks into one installable requirement set
+
+    Inline comments and blank lines are stripped, standard library modules (which pip
+    cannot install and which abort the whole install) are pruned, bare import names such
+    as `yaml` are replaced by their distribution name, and entries repeated
+    across blocks are collapsed to the first occurrence, preferring one that pins a
+    version over a bare name.
+
+    Args:
+        blocks (str): requirements.txt fragments, in priority order
+
+    Returns:
+        dict: `requirements` (the compiled text), `packages` (kept entries) and
+        `removed` (list of (entry, reason) tuples)
+    """
+    kept: Dict[str, str] = {}
+    removed: List[tuple] = []
+
+    for block in blocks:
+        for line in block.splitlines():
+            entry = COMMENT.sub("", line).strip()
+            if not entry:
+                continue
+
+            # Options (-r, --index-url, ...) and URLs pass through untouched
+            match = NAME.match(entry)
+            if entry.startswith("-") or not match:
+                kept.setdefault(entry, entry)
+                continue
+
+            name = match.group(1)
+            if is_stdlib(name) and not SPECIFIER.search(entry[len(name):]):
+                removed.append((entry, "standard library"))
+                continue
+
+            if name in IMPORT_ALIASES and entry == name:
+                removed.append((entry, f"import name of {IMPORT_ALIASES[name]}"))
+                entry = name = IMPORT_ALIASES[name]
+
+            key = canonical_name(name)
+            if key not in kept:
+                kept[key] = entry
+            elif SPECIFIER.search(entry) and not SPECIFIER.search(kept[key]):
+                removed.append((kept[key], "duplicate"))
+                kept[key] = entry
+            else:
+                removed.append((entry, "duplicate"))
+
+    packages = list(kept.values())
+    requirements = "# Requirements for your project\n" + "".join(f"{p}\n" for p in packages)
+    return {
+        "requirements": requirements,
+        "packages": packages,
+        "removed": removed
+    }
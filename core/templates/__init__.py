@@ -0,0 +1,219 @@
+"""
+Declarative project templates and the engine that compiles them into write plans
+
+Every template is a `<name>/template.json` resource in this package:
+
+    {
+      "extends": "_base",
+      "variables": ["secret_key"],
+      "readme": {"overview": "...", "structure": "web-django/readme-structure.md.tmpl", "setup": "..."},
+      "gitignore": "web-django/gitignore.tmpl",
+      "directories": ["@@name@@", "static/css"],
+      "files": {
+        "main.py": "# literal content\n",
+        "@@name@@/settings.py": {"render": "web-django/settings.py.tmpl"},
+        "requirements.lock": {"content": "constants:lock", "optional": true}
+      },
+      "requirements": [{"group": "core", "profile": "minimal", "packages": ["django"]}]
+    }
+
+File bodies live next to the manifest as `.tmpl` resources and are read only when a
+project of that template is generated. `@@name@@` placeholders in bodies, paths and
+literal content are replaced with template variables; the `@@` delimiter does not occur
+in Python, HTML, Jinja or Django template syntax, so bodies need no escaping.
+`{"content": "<source>:<key>"}` entries are computed by the caller (requirements, README).
+A template inherits everything from the one it extends; names starting with `_` are
+shared bases, not selectable templates. `index.json` lists the selectable templates in
+display order with their descriptions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+# No typing or core.write_plan import: `inventrix list` and `--help` load this module,
+# and those imports alone cost more than the rest of the command
+
+PLACEHOLDER = re.compile(r"@@([a-z_]+)@@")
+
+
+def _read_text(path: str) -> str:
+    # The package loader reads from a checkout and from inside a zipapp alike, without
+    # the import cost of importlib.resources on the `list` and `--help` path
+    data = __spec__.loader.get_data(os.path.join(os.path.dirname(__file__), *path.split("/")))
+    return data.decode('utf-8')
+
+
+def _read_json(path: str) -> dict:
+    return json.loads(_read_text(path))
+
+
+@lru_cache(maxsize=None)
+def template_index() -> dict[str, str]:
+    """Description of every selectable template, in display order"""
+    return _read_json("index.json")
+
+
+def template_names() -> list[str]:
+    """Names of the selectable templates"""
+    return list(template_index())
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str) -> dict:
+    """
+    Load a template manifest with everything it inherits merged in
+
+    Args:
+        name (str): Template name (or a `_` base)
+
+    Returns:
+        dict: `variables`, `readme`, `gitignore`, `directories`, `files` and
+        `requirements`; treat as read-only
+    """
+    if name not in template_index() and not name.startswith("_"):
+        raise ValueError(f"Unknown template: {name}")
+    try:
+        own = _read_json(f"{name}/template.json")
+    except OSError:
+        raise ValueError(f"Unknown template: {name}") from None
+
+    merged = {"variables": [], "readme": {}, "gitignore": None, "directories": [], "files": {}, "requirements": []}
+    if own.get("extends"):
+        parent = load_template(own["extends"])
+        merged = {key: value.copy() if hasattr(value, "copy") else value for key, value in parent.items()}
+
+    merged["variables"].extend(v for v in own.get("variables", []) if v not in merged["variables"])
+    merged["readme"].update(own.get("readme", {}))
+    merged["gitignore"] = own.get("gitignore", merged["gitignore"])
+    merged["directories"].extend(d for d in own.get("directories", []) if d not in merged["directories"])
+    merged["files"].update(own.get("files", {}))
+    merged["requirements"].extend(own.get("requirements", []))
+    return merged
+
+
+@lru_cache(maxsize=None)
+def read_resource(path: str) -> str:
+    """Text of a template resource, e.g. `web-django/settings.py.tmpl`"""
+    return _read_text(path)
+
+
+class CompiledText:
+    """
+    Template text split once into literal runs and the placeholder slots between them
+
+    Rendering joins the literals with the slot values instead of scanning the text again.
+
+    Args:
+        text (str): Template text with `@@name@@` placeholders
+    """
+
+    __slots__ = ("literals", "slots")
+
+    def __init__(self, text: str):
+        parts = PLACEHOLDER.split(text)
+        self.literals = parts[0::2]
+        self.slots = parts[1::2]
+
+    def render(self, variables: dict[str, str]) -> str:
+        """Fill the slots; an unknown placeholder raises ValueError"""
+        if not self.slots:
+            return self.literals[0]
+        try:
+            values = [variables[slot] for slot in self.slots]
+        except KeyError as e:
+            raise ValueError(f"No value for template placeholder @@{e.args[0]}@@") from None
+        pieces = [self.literals[0]]
+        for value, literal in zip(values, self.literals[1:]):
+            pieces.append(value)
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=1024)
+def compile_text(text: str) -> CompiledText:
+    """Compiled form of a template string (paths, literal content, resource bodies)"""
+    return CompiledText(text)
+
+
+def render(text: str, variables: dict[str, str]) -> str:
+    """
+    Replace `@@name@@` placeholders
+
+    Args:
+        text (str): Template text
+        variables (dict): Placeholder values
+
+    Returns:
+        str: Rendered text; an unknown placeholder raises ValueError
+    """
+    return compile_text(text).render(variables)
+
+
+def cache_key(variables: dict[str, str]) -> tuple:
+    """Hashable form of a variables dict for the render caches"""
+    return tuple(sorted(variables.items()))
+
+
+@lru_cache(maxsize=256)
+def render_tree(name: str, variables: tuple) -> tuple:
+    """
+    Rendered directories and files of a template, cached by template and variables
+
+    Args:
+        name (str): Template name
+        variables (tuple): `cache_key` of the placeholder values
+
+    Returns:
+        tuple: (directories, files) where files holds (path, content, spec) triples and
+        content is None for `content` references the caller computes
+    """
+    values = dict(variables)
+    template = load_template(name)
+    directories = tuple(render(directory, values) for directory in template["directories"])
+    files = []
+    for path, spec in template["files"].items():
+        if isinstance(spec, str):
+            content = render(spec, values)
+        elif "render" in spec:
+            content = render(read_resource(spec["render"]), values)
+        else:
+            content = None
+        files.append((render(path, values), content, spec))
+    return directories, tuple(files)
+
+
+def compile_template(name: str, plan, variables: dict[str, str],
+                     resolve: Callable[[str], str | None]):
+    """
+    Queue every directory and file of a template in a write plan
+
+    Args:
+        name (str): Template name
+        plan (WritePlan): Plan to fill
+        variables (dict): Placeholder values, e.g. {"name": "my_app"}
+        resolve (callable): Returns the content for a `<source>:<key>` reference, or
+            None when an optional file should be left out
+
+    Returns:
+        WritePlan: The same plan
+    """
+    directories, files = render_tree(name, cache_key(variables))
+
+    for directory in directories:
+        plan.add_dir(directory)
+
+    for path, content, spec in files:
+        if content is None:
+            content = resolve(spec["content"])
+            if content is None:
+                if spec.get("optional"):
+                    continue
+                raise ValueError(f"Template {name}: no content for {spec['content']}")
+        plan.add_file(path, content)
+
+    return plan
@@ -0,0 +1,296 @@
+"""
+Phase timings - nested spans recorded across scaffolding and builds
+
+Instrumented code wraps its phases in `span(name)`. Nothing is recorded until `enable()`
+is called (the CLI does for `--timings`, `--timings-json` and `--trace`); until then a span is a
+shared no-op object, so the instrumentation stays in place at no measurable cost.
+
+The current span lives in a context variable: spans nest within a thread, and work
+handed to a thread pool through `bind` is recorded under the span that submitted it.
+Subprocesses started through `run` record their pid, so a Chrome trace (`to_trace`,
+behind `--trace`) shows each child on its own track next to the thread that waited on it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextvars import ContextVar, copy_context
+
+# No threading or contextlib import: `inventrix config` loads this module through ComPy
+
+_current = ContextVar("inventrix_span", default=None)
+_recorder = None
+
+
+class Span:
+    """
+    One timed phase; use as a context manager
+
+    Args:
+        recorder (Timings): Where the finished span is recorded
+        name (str): Phase name, e.g. "write"
+        args (dict): Details shown with the span, e.g. {"files": 12}
+    """
+
+    __slots__ = ("recorder", "name", "args", "path", "thread", "tid", "start", "seconds", "_token")
+
+    def __init__(self, recorder: Timings, name: str, args: dict):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.seconds = None
+
+    def set(self, **args):
+        """Attach details learned while the span runs"""
+        self.args.update(args)
+
+    def __enter__(self):
+        parent = _current.get()
+        self.path = f"{parent.path}/{self.name}" if parent else self.name
+        self.tid, self.thread = self.recorder.current_thread()
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self.start
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.recorder.record(self)
+        return False
+
+
+class _NoSpan:
+    """Stand-in returned by `span` while timings are disabled"""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Timings:
+    """
+    Spans finished during one run, from any thread
+
+    Args:
+        label (str): What was run, e.g. "init my_app -t web-flask"
+    """
+
+    def __init__(self, label: str = ""):
+        import threading
+        self.label = label
+        self.started = time.time()
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._threading = threading
+
+    def current_thread(self) -> tuple:
+        thread = self._threading.current_thread()
+        return thread.ident, thread.name
+
+    def record(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def phases(self) -> list[dict]:
+        """
+        Spans aggregated by nesting path, in the order each path first started
+
+        Returns:
+            list: dicts with `path`, `name`, `depth`, `calls`, `seconds` (total) and `max`
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        rows = {}
+        for span in spans:
+            row = rows.get(span.path)
+            if row is None:
+                row = rows[span.path] = {"path": span.path, "name": span.name,
+                                         "depth": span.path.count("/"), "calls": 0,
+                                         "seconds": 0.0, "max": 0.0}
+            row["calls"] += 1
+            row["seconds"] += span.seconds
+            row["max"] = max(row["max"], span.seconds)
+        # Children directly under their parent, siblings by first start
+        first = {path: index for index, path in enumerate(rows)}
+
+        def position(row):
+            parts = row["path"].split("/")
+            return [first.get("/".join(parts[:depth]), -1) for depth in range(1, len(parts) + 1)]
+
+        return sorted(rows.values(), key=position)
+
+    def wall(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def to_dict(self) -> dict:
+        """Machine-readable form: run totals, aggregated phases and every span"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            "label": self.label,
+            "started": self.started,
+            "wall_seconds": round(self.wall(), 6),
+            "pid": os.getpid(),
+            "phases": [{key: round(value, 6) if isinstance(value, float) else value
+                        for key, value in row.items()} for row in self.phases()],
+            "spans": [{
+                "name": span.name,
+                "path": span.path,
+                "thread": span.thread,
+                "start": round(span.start - self.origin, 6),
+                "seconds": round(span.seconds, 6),
+                "args": span.args
+            } for span in spans]
+        }
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def to_trace(self) -> dict:
+        """
+        Chrome trace-event form of the spans, for chrome://tracing or ui.perfetto.dev
+
+        Every span is a complete ("X") event on the thread that ran it. A span that
+        started a subprocess is repeated on a track of its own under the child's pid.
+
+        Returns:
+            dict: Trace in the JSON object format (`traceEvents`)
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        pid = os.getpid()
+
+        def micros(seconds):
+            return round(seconds * 1e6, 3)
+
+        events = [{"ph": "M", "name": "process_name", "pid": pid, "tid": 0,
+                   "args": {"name": f"inventrix {self.label}".strip()}}]
+        threads = {}
+        for span in spans:
+            threads.setdefault(span.tid, span.thread)
+            event = {"name": span.name, "cat": span.path.split("/")[0], "ph": "X",
+                     "ts": micros(span.start - self.origin), "dur": micros(span.seconds),
+                     "pid": pid, "tid": span.tid, "args": {"path": span.path, **span.args}}
+            events.append(event)
+            child = span.args.get("child_pid")
+            if child:
+                events.append({"ph": "M", "name": "process_name", "pid": child, "tid": child,
+                               "args": {"name": span.args.get("command", span.name)}})
+                events.append({**event, "pid": child, "tid": child})
+        events.extend({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}}
+                      for tid, name in threads.items())
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"label": self.label, "started": self.started}
+        }
+
+    def save_trace(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_trace(), f, default=str)
+
+    def format_table(self) -> str:
+        """Breakdown table, one row per phase path, nested by indentation"""
+        wall = self.wall()
+        lines = [f"\n⏱️  Timings: {self.label} (wall {wall * 1000:.1f} ms)",
+                 f"   {'phase':<34} {'calls':>6} {'total':>11} {'max':>11} {'wall':>6}"]
+        for row in self.phases():
+            name = "  " * row["depth"] + row["name"]
+            share = row["seconds"] / wall * 100 if wall else 0.0
+            lines.append(f"   {name:<34} {row['calls']:>6} {row['seconds'] * 1000:>8.1f} ms "
+                         f"{row['max'] * 1000:>8.1f} ms {share:>5.0f}%")
+        if len(lines) == 2:
+            lines.append("   (no phases recorded)")
+        return "\n".join(lines)
+
+
+def enable(label: str = "") -> Timings:
+    """Start recording spans for the rest of the process"""
+    global _recorder
+    _recorder = Timings(label)
+    return _recorder
+
+
+def recorder() -> Timings | None:
+    """The active recorder, or None while timings are disabled"""
+    return _recorder
+
+
+def span(name: str, **args):
+    """
+    Time a phase
+
+    Args:
+        name (str): Phase name, nested under the current span
+        **args: Details recorded with the span
+
+    Returns:
+        Span: Context manager (a no-op while timings are disabled)
+    """
+    if _recorder is None:
+        return _NO_SPAN
+    return Span(_recorder, name, args)
+
+
+def bind(fn):
+    """
+    Wrap a callable so it runs under the current span, for handing work to a thread pool
+
+    Every call runs in its own copy of the caller's context, so the wrapper may run
+    on several threads at once.
+    """
+    if _recorder is None:
+        return fn
+    context = copy_context()
+
+    def bound(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return bound
+
+
+def run(name: str, args, check: bool = False, capture_output: bool = False, **kwargs):
+    """
+    `subprocess.run` inside a span that records the child's pid and exit code
+
+    Args:
+        name (str): Span name, e.g. "pip install"
+        args (list): Command line
+        check (bool): Raise CalledProcessError on a non-zero exit
+        capture_output (bool): Collect stdout and stderr
+        **kwargs: Passed to `subprocess.Popen` (cwd, env, text, stdout, ...)
+
+    Returns:
+        CompletedProcess: As returned by `subprocess.run`
+    """
+    import subprocess
+    if capture_output:
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+    with span(name, command=" ".join(str(arg) for arg in args)) as current:
+        with subprocess.Popen(args, **kwargs) as process:
+            current.set(child_pid=process.pid)
+            try:
+                stdout, stderr = process.communicate()
+            except BaseException:
+                process.kill()
+                raise
+        current.set(returncode=process.returncode)
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args, stdout, stderr)
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
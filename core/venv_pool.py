@@ -0,0 +1,127 @@
+"""
+Pool of pre-built, fully installed virtual environments per template
+"""
+
+import json
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+from core.cache import cache_dir
+from core.environment import create_venv, install_requirements, relocate_venv, requirements_key
+
+
+class VenvPool:
+    """
+    Keeps ready-made venvs in the Inventrix cache so `init` can claim one by rename
+
+    Slots live in `<cache>/pool/<template>/<requirements hash>/ready-<id>`. A slot is
+    built under a `building-<id>` name and only renamed to `ready-<id>` once pip has
+    finished, so a claim never sees a half-installed environment. Claiming is a single
+    rename, which makes it safe for several `init` runs to compete for the same slots.
+
+    Args:
+        root (Path): Pool directory (default: `<cache>/pool`)
+    """
+
+    MARKER = ".inventrix-pool.json"
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else cache_dir("pool")
+
+    def _slot_dir(self, template: str, requirements: str) -> Path:
+        return self.root / template / requirements_key(requirements)
+
+    def ready_slots(self, template: str, requirements: str) -> List[Path]:
+        """Ready venvs for a template and requirement set, oldest first"""
+        slot_dir = self._slot_dir(template, requirements)
+        if not slot_dir.is_dir():
+            return []
+        slots = [p for p in slot_dir.iterdir() if p.name.startswith("ready-")]
+        return sorted(slots, key=lambda p: p.stat().st_mtime)
+
+    def warm(self, template: str, requirements: str, size: int) -> int:
+        """
+        Top the pool up to `size` ready venvs
+
+        Args:
+            template (str): Template the venvs are built for
+            requirements (str): Content of the template's requirements.txt
+            size (int): Number of ready venvs to keep
+
+        Returns:
+            int: Number of venvs built
+        """
+        slot_dir = self._slot_dir(template, requirements)
+        slot_dir.mkdir(parents=True, exist_ok=True)
+        requirements_path = slot_dir / "requirements.txt"
+        requirements_path.write_text(requirements, encoding='utf-8')
+
+        missing = max(0, size - len(self.ready_slots(template, requirements)))
+        for index in range(missing):
+            slot_id = uuid.uuid4().hex[:12]
+            building = slot_dir / f"building-{slot_id}"
+            print(f"🔥 Warming {template} venv {index + 1}/{missing}")
+            try:
+                create_venv(building, prompt="venv")
+                install_requirements(building, requirements_path)
+                with open(building / self.MARKER, 'w', encoding='utf-8') as f:
+                    json.dump({"template": template, "built_at": str(building)}, f)
+                os.rename(building, slot_dir / f"ready-{slot_id}")
+            except BaseException:
+                shutil.rmtree(building, ignore_errors=True)
+                raise
+        return missing
+
+    def claim(self, template: str, requirements: str, dest: Path) -> bool:
+        """
+        Move a ready venv to `dest` and fix up its embedded paths
+
+        Args:
+            template (str): Template the project uses
+            requirements (str): Content of the project's requirements.txt
+            dest (Path): Final venv location, which must not exist yet
+
+        Returns:
+            bool: True if a venv was claimed, False if the pool had none to offer
+        """
+        # Windows console-script launchers embed the venv path in a binary
+        if sys.platform == "win32":
+            return False
+
+        dest = Path(dest)
+        for slot in self.ready_slots(template, requirements):
+            try:
+                os.rename(slot, dest)
+            except FileNotFoundError:
+                continue  # Claimed by a concurrent init
+            except OSError:
+                return False  # Pool lives on another filesystem
+
+            marker = dest / self.MARKER
+            with open(marker, 'r', encoding='utf-8') as f:
+                built_at = json.load(f)["built_at"]
+            relocate_venv(dest, built_at)
+            marker.unlink()
+            return True
+        return False
+
+    def status(self) -> Dict[str, int]:
+        """Number of ready venvs per template"""
+        counts = {}
+        if not self.root.is_dir():
+            return counts
+        for template_dir in sorted(self.root.iterdir()):
+            if template_dir.is_dir():
+                counts[template_dir.name] = sum(
+                    1 for p in template_dir.glob("*/ready-*") if p.is_dir()
+                )
+        return counts
+
+    def clear(self, template: str = None):
+        """Remove all pooled venvs, or only those of one template"""
+        target = self.root / template if template else self.root
+        shutil.rmtree(target, ignore_errors=True)
@@ -0,0 +1,93 @@
+"""
+Local wheelhouse so template requirements install without touching a package index
+"""
+
+import json
+import os
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core import timings
+from core.cache import cache_dir
+from core.environment import pip_index_args, requirements_key
+
+
+class Wheelhouse:
+    """
+    Directory of wheels covering every template's requirement set
+
+    `sync` builds wheels for several requirement sets concurrently with `pip wheel`
+    (one pip process per template) and stamps each template whose set resolved
+    completely. `install_args` then lets pip install from the wheelhouse alone.
+
+    Args:
+        root (Path): Wheelhouse directory (default: `<cache>/wheelhouse`)
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else cache_dir("wheelhouse")
+        self.stamps = self.root / ".synced"
+        self.stamps.mkdir(parents=True, exist_ok=True)
+
+    def _stamp_path(self, requirements: str) -> Path:
+        return self.stamps / f"{requirements_key(requirements)}.json"
+
+    def covers(self, requirements: str) -> bool:
+        """True if a previous sync resolved this exact requirement set"""
+        return self._stamp_path(requirements).exists()
+
+    def install_args(self) -> List[str]:
+        """pip arguments that install from the wheelhouse only"""
+        return ["--no-index", "--find-links", str(self.root)]
+
+    def _sync_one(self, template: str, requirements: str, index_args: List[str]) -> Tuple[bool, str]:
+        requirements_path = self.stamps / f".{template}.{uuid.uuid4().hex[:8]}.txt"
+        requirements_path.write_text(requirements, encoding='utf-8')
+        cmd = [sys.executable, "-m", "pip", "wheel", "--quiet",
+               "-r", str(requirements_path), "-w", str(self.root)] + index_args
+        try:
+            result = timings.run("pip wheel", cmd, capture_output=True, text=True)
+        finally:
+            requirements_path.unlink()
+
+        if result.returncode != 0:
+            lines = (result.stderr or result.stdout).strip().splitlines()
+            return False, lines[-1] if lines else f"pip exited with {result.returncode}"
+
+        temp = self.stamps / f".{uuid.uuid4().hex[:8]}"
+        temp.write_text(json.dumps({"template": template}), encoding='utf-8')
+        os.replace(temp, self._stamp_path(requirements))
+        return True, "synced"
+
+    def sync(self, requirement_sets: Dict[str, str], max_workers: int = 4,
+             index_url: Optional[str] = None, find_links: Optional[str] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Fetch and build wheels for several requirement sets concurrently
+
+        Args:
+            requirement_sets (dict): requirements.txt content by template name
+            max_workers (int): Number of concurrent pip processes
+            index_url (str): Package index to use instead of pip's configured one
+            find_links (str): Local directory of distributions; disables the index
+
+        Returns:
+            dict: (success, message) by template name
+        """
+        index_args = pip_index_args(index_url, find_links)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                template: pool.submit(self._sync_one, template, requirements, index_args)
+                for template, requirements in requirement_sets.items()
+            }
+            return {template: future.result() for template, future in futures.items()}
+
+    def status(self) -> Dict[str, int]:
+        """Number of wheels and synced requirement sets"""
+        return {
+            "wheels": sum(1 for _ in self.root.glob("*.whl")),
+            "synced": sum(1 for _ in self.stamps.glob("*.json"))
+        }
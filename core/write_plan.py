@@ -0,0 +1,149 @@
+"""
+Write plans - collect every directory and file a template produces and emit them in one pass
+"""
+
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
+
+from core import timings
+
+# File systems where every open/write/close is a network round trip
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p", "ceph",
+                       "glusterfs", "fuse.glusterfs", "lustre", "afs"}
+
+
+@functools.lru_cache(maxsize=1)
+def _mount_table() -> tuple:
+    """(mount point, file system type) pairs from /proc/mounts, longest mount point first"""
+    try:
+        with open("/proc/mounts", 'r') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return ()
+    mounts = [(mount.replace("\\040", " "), fstype) for mount, fstype in mounts]
+    return tuple(sorted(mounts, key=lambda m: len(m[0]), reverse=True))
+
+
+# Answers of `is_network_path` by device, so each init costs one stat
+_network_devices: Dict[int, bool] = {}
+
+
+def is_network_path(path: Path) -> bool:
+    """True if the existing `path` lives on a network file system (a UNC path on Windows)"""
+    if sys.platform == "win32":
+        return str(path).startswith("\\\\")
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return False
+    if device not in _network_devices:
+        real = os.path.realpath(path)
+        fstype = next((fstype for mount, fstype in _mount_table()
+                       if real == mount or real.startswith(mount.rstrip("/") + "/")), None)
+        _network_devices[device] = fstype in NETWORK_FILESYSTEMS
+    return _network_devices[device]
+
+
+class WritePlan:
+    """
+    Collects the directories and files of a project tree before anything touches the disk
+
+    Paths are relative to the plan root and use forward slashes. Executing the plan
+    creates the minimal set of directories once and then writes the files. On a network
+    file system they go through a bounded thread pool, which hides per-file round trips;
+    on local disks the pool only adds overhead (about 0.65x the serial speed for any
+    file count), so they are written serially.
+
+    Args:
+        root (Path): Directory the plan is emitted into
+        max_workers (int): Concurrent file writes (default: a pool on network file
+            systems, serial elsewhere); values above 1 force the pool
+    """
+
+    DEFAULT_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+    def __init__(self, root: Path, max_workers: Optional[int] = None):
+        self.root = Path(root)
+        self.max_workers = max_workers
+        self.directories = set()
+        self.files: Dict[str, str] = {}
+
+    def add_dir(self, dirpath: str):
+        """Register a directory (and implicitly all of its parents)"""
+        self.directories.add(self._normalize(dirpath))
+
+    def add_file(self, filepath: str, content: str = ""):
+        """Register a file; a later call for the same path replaces the content"""
+        self.files[self._normalize(filepath)] = content
+
+    def _normalize(self, path: str) -> str:
+        normalized = PurePosixPath(str(path).replace("\\", "/"))
+        if normalized.is_absolute() or ".." in normalized.parts:
+            raise ValueError(f"Plan paths must stay inside the project: {path}")
+        return normalized.as_posix()
+
+    def minimal_directories(self) -> List[str]:
+        """
+        Directories that must be created explicitly
+
+        Every registered directory and every file parent is collapsed to its leaves:
+        a directory that is the parent of another one is created implicitly by
+        `mkdir(parents=True)` and is dropped from the list.
+
+        Returns:
+            list: Sorted leaf directories relative to the plan root
+        """
+        wanted = set(self.directories)
+        for filepath in self.files:
+            parent = PurePosixPath(filepath).parent.as_posix()
+            if parent != ".":
+                wanted.add(parent)
+        wanted.discard(".")
+
+        ancestors = set()
+        for directory in wanted:
+            ancestors.update(p.as_posix() for p in PurePosixPath(directory).parents)
+        return sorted(wanted - ancestors)
+
+    def _write(self, item):
+        relpath, content = item
+        size = len(content.encode('utf-8'))
+        with timings.span("file", path=relpath, bytes=size):
+            with open(self.root / relpath, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return size
+
+    def execute(self) -> Dict[str, int]:
+        """
+        Emit the plan to disk
+
+        Returns:
+            dict: Counts of directories created, files written and bytes written
+        """
+        directories = self.minimal_directories()
+        with timings.span("mkdir", directories=len(directories)):
+            self.root.mkdir(parents=True, exist_ok=True)
+            for directory in directories:
+                with timings.span("dir", path=directory):
+                    (self.root / directory).mkdir(parents=True, exist_ok=True)
+
+        items = sorted(self.files.items())
+        workers = self.max_workers
+        if workers is None:
+            workers = self.DEFAULT_MAX_WORKERS if len(items) > 1 and is_network_path(self.root) else 1
+        with timings.span("write", files=len(items), workers=workers):
+            if workers <= 1 or len(items) <= 1:
+                written = [self._write(item) for item in items]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    written = list(pool.map(timings.bind(self._write), items))
+
+        return {
+            "directories": len(directories),
+            "files": len(items),
+            "bytes": sum(written)
+        }
@@ -0,0 +1,58 @@
+"""
+Creator thread-safety contract: separate instances generate projects concurrently
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.creation import Creator
+
+
+class ConcurrentCreationTest(unittest.TestCase):
+    PROJECTS = 48
+    THREADS = 16
+
+    def setUp(self):
+        self.parent = Path(tempfile.mkdtemp(prefix="inventrix-test-"))
+        self.addCleanup(shutil.rmtree, self.parent, ignore_errors=True)
+
+    def test_parallel_projects_match_their_templates(self):
+        templates = Creator.VALID_TEMPLATES
+        jobs = [(f"project_{i}", templates[i % len(templates)]) for i in range(self.PROJECTS)]
+        cwd = os.getcwd()
+
+        def create(job):
+            name, template = job
+            creator = Creator(name=name, description=f"{template} test", template=template,
+                              base_dir=str(self.parent), provision=False)
+            creator.creating_project_structure()
+            return creator
+
+        # Output of every thread goes to the same buffer; only the trees are checked
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=self.THREADS) as pool:
+                creators = list(pool.map(create, jobs))
+
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(sorted(p.name for p in self.parent.iterdir()), sorted(name for name, _ in jobs))
+        for creator in creators:
+            with self.subTest(project=creator.name, template=creator.template):
+                on_disk = {path.relative_to(creator.base_path).as_posix()
+                           for path in creator.base_path.rglob("*") if path.is_file()}
+                self.assertEqual(on_disk, set(creator.plan.files))
+                for relpath, content in creator.plan.files.items():
+                    written = (creator.base_path / relpath).read_text(encoding='utf-8')
+                    self.assertEqual(written, content, relpath)
+
+
+if __name__ == "__main__":
+    unittest.main()
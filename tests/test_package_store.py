@@ -0,0 +1,93 @@
+"""
+Package store: ingest and populate of console scripts and data files outside site-packages
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.environment import venv_bin_dir, venv_python, venv_site_packages
+from core.package_store import PackageStore, script_header
+
+SCRIPT_BODY = "import sys\nfrom demo.cli import main\nsys.exit(main())\n"
+KERNEL = '{"argv": ["python", "-m", "demo_kernel"]}\n'
+
+
+def fake_venv(path: Path) -> Path:
+    """Directory layout of a venv (no interpreter needed) with one demo distribution"""
+    site_packages = venv_site_packages(path)
+    site_packages.mkdir(parents=True)
+    venv_bin_dir(path).mkdir(parents=True, exist_ok=True)
+    python = str(venv_python(path))
+
+    files = {
+        "demo/__init__.py": "VERSION = '1.0'\n",
+        "demo/cli.py": "def main():\n    return 0\n",
+        os.path.relpath(venv_bin_dir(path) / "demo", site_packages): script_header(python).decode() + SCRIPT_BODY,
+        os.path.relpath(path / "share" / "jupyter" / "kernels" / "demo" / "kernel.json", site_packages): KERNEL,
+    }
+    dist_info = site_packages / "demo-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: demo\nVersion: 1.0\n\n", encoding='utf-8')
+    (dist_info / "WHEEL").write_text("Wheel-Version: 1.0\nTag: py3-none-any\n", encoding='utf-8')
+    for relpath, content in files.items():
+        target = Path(os.path.normpath(site_packages / relpath))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding='utf-8')
+    with open(dist_info / "RECORD", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        for relpath in [*files, "demo-1.0.dist-info/METADATA", "demo-1.0.dist-info/RECORD"]:
+            writer.writerow([Path(relpath).as_posix(), "", ""])
+    return path
+
+
+class PackageStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="inventrix-test-"))
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.store = PackageStore(self.tmp / "store")
+
+    def ingest_and_populate(self, source: Path, target: Path) -> Path:
+        keys = self.store.ingest(fake_venv(source))
+        venv_site_packages(target).mkdir(parents=True)
+        venv_bin_dir(target).mkdir(parents=True, exist_ok=True)
+        self.store.populate(target, list(keys.values()))
+        return target
+
+    def test_data_files_keep_their_location(self):
+        target = self.ingest_and_populate(self.tmp / "a" / "venv", self.tmp / "b" / "venv")
+        kernel = target / "share" / "jupyter" / "kernels" / "demo" / "kernel.json"
+        self.assertEqual(kernel.read_text(encoding='utf-8'), KERNEL)
+        self.assertEqual(sorted(p.name for p in venv_bin_dir(target).iterdir()), ["demo"])
+        self.assertTrue((venv_site_packages(target) / "demo" / "cli.py").is_file())
+
+    def test_short_shebang_is_rewritten(self):
+        target = self.ingest_and_populate(self.tmp / "a" / "venv", self.tmp / "b" / "venv")
+        script = (venv_bin_dir(target) / "demo").read_text(encoding='utf-8')
+        self.assertEqual(script, f"#!{venv_python(target)}\n" + SCRIPT_BODY)
+
+    def test_long_interpreter_paths_use_the_sh_header(self):
+        deep = self.tmp.joinpath(*["d" * 40] * 3)
+        source = deep / "source venv"  # Spaces and more than 127 bytes: pip's /bin/sh form
+        target = self.ingest_and_populate(source, deep / "target" / "venv")
+        script = (venv_bin_dir(target) / "demo").read_text(encoding='utf-8')
+        self.assertTrue(script.startswith("#!/bin/sh\n'''exec' "), script)
+        self.assertEqual(script, script_header(str(venv_python(target))).decode() + SCRIPT_BODY)
+        self.assertNotIn(str(source), script)
+
+    def test_long_header_becomes_short_again(self):
+        deep = self.tmp.joinpath(*["d" * 40] * 3) / "venv"
+        target = self.ingest_and_populate(deep, self.tmp / "b" / "venv")
+        script = (venv_bin_dir(target) / "demo").read_text(encoding='utf-8')
+        self.assertEqual(script, f"#!{venv_python(target)}\n" + SCRIPT_BODY)
+
+
+if __name__ == "__main__":
+    unittest.main()
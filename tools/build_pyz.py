@@ -0,0 +1,109 @@
+"""
+Build a self-contained `inventrix.pyz` with the standard library `zipapp`
+
+Usage: python tools/build_pyz.py [-o dist/inventrix.pyz] [--python "/usr/bin/env python3"] [--optimize 2] [--compress]
+
+The archive holds the `core` package with its template resources and a `__main__.py`
+that calls `core.cli.main`, so build agents run `python inventrix.pyz <command>` (or the
+archive itself, through its shebang) without a checkout.
+
+Every module is precompiled to an unchecked hash-based `.pyc` next to its source.
+zipimport loads those directly: nothing is compiled on first use, and since the archive
+is never edited in place there is no source to check them against. Sources stay in the
+archive for tracebacks, and for interpreters of another version, which reject the bytecode
+and compile the sources instead.
+"""
+
+import argparse
+import py_compile
+import shutil
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+MAIN = '''"""Inventrix - Intelligent Project Scaffolding and Compilation Tool"""
+
+from core.cli import main
+
+main()
+'''
+
+# Never shipped: caches and bytecode of the local interpreter
+EXCLUDE = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo")
+
+
+def stage(source: Path, staging: Path, archive_name: str, optimize: int) -> int:
+    """
+    Copy the package into a staging directory and precompile it
+
+    Args:
+        source (Path): Checkout root holding `core`
+        staging (Path): Empty directory that becomes the archive root
+        archive_name (str): File name of the archive, used in traceback paths
+        optimize (int): Bytecode optimization level (2 strips docstrings and asserts)
+
+    Returns:
+        int: Number of modules compiled
+    """
+    shutil.copytree(source / "core", staging / "core", ignore=EXCLUDE)
+    (staging / "__main__.py").write_text(MAIN, encoding='utf-8')
+
+    modules = sorted(staging.rglob("*.py"))
+    for module in modules:
+        relative = module.relative_to(staging).as_posix()
+        # zipimport only looks for `<module>.pyc` beside the source, not in __pycache__
+        py_compile.compile(str(module), cfile=str(module.with_suffix(".pyc")),
+                           dfile=f"{archive_name}/{relative}", doraise=True, optimize=optimize,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    return len(modules)
+
+
+def build(output: Path, interpreter: str = None, optimize: int = 2, compress: bool = False) -> dict:
+    """
+    Build the archive
+
+    Args:
+        output (Path): Archive to write
+        interpreter (str): Shebang interpreter, e.g. "/usr/bin/env python3" (default: none)
+        optimize (int): Bytecode optimization level
+        compress (bool): Deflate the members (smaller, but slower to start)
+
+    Returns:
+        dict: `path`, `modules`, `bytes` and `seconds`
+    """
+    start = time.perf_counter()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as temp:
+        staging = Path(temp) / "inventrix"
+        modules = stage(REPO, staging, output.name, optimize)
+        zipapp.create_archive(staging, output, interpreter=interpreter, compressed=compress)
+    return {
+        "path": output,
+        "modules": modules,
+        "bytes": output.stat().st_size,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build inventrix as a single zipapp")
+    parser.add_argument("-o", "--output", type=Path, default=REPO / "dist" / "inventrix.pyz",
+                        help="Archive to write (default: dist/inventrix.pyz)")
+    parser.add_argument("--python", dest="interpreter", default="/usr/bin/env python3",
+                        help="Shebang interpreter; pass an empty string for none")
+    parser.add_argument("--optimize", type=int, choices=[0, 1, 2], default=2,
+                        help="Bytecode optimization level (default: 2)")
+    parser.add_argument("--compress", action="store_true", help="Deflate the archive members")
+    args = parser.parse_args()
+
+    result = build(args.output, args.interpreter or None, args.optimize, args.compress)
+    print(f"✅ {result['path']}: {result['modules']} modules, {result['bytes'] / 1024:.0f} KiB "
+          f"in {result['seconds']:.2f}s (built for Python {sys.version_info.major}.{sys.version_info.minor})")
+
+
+if __name__ == "__main__":
+    main()